@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2024, Chase Woodard <chasewoodard93@users.noreply.github.com>
+# MIT License
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import os
+from datetime import datetime
+
+from ansible_collections.chasewoodard93.srlinux.plugins.module_utils.srlinux_async import backup_host
+from ansible_collections.chasewoodard93.srlinux.plugins.modules.srlinux_backup import ARGUMENT_SPEC
+from ansible_collections.chasewoodard93.srlinux.plugins.plugin_utils.srlinux_fanout import FanoutActionModule
+
+
+BACKUP_COMMANDS = {
+    'set': 'info flat',
+    'json': 'info from running / | as json',
+}
+
+
+class ActionModule(FanoutActionModule):
+    """Back up many SR Linux devices concurrently from the controller"""
+
+    ARGUMENT_SPEC = ARGUMENT_SPEC
+    FANOUT_NAME = 'backups'
+    HOST_FAILED_MSG = 'Backup failed'
+
+    def _build_jobs(self, args, targets, result):
+        backup_dir = args['backup_dir']
+        format_type = args['format']
+        extension = 'json' if format_type == 'json' else 'cfg'
+        suffix = ''
+        if args['include_timestamp']:
+            suffix = '_' + datetime.now().strftime('%Y-%m-%d_%H%M%S')
+
+        paths = dict(
+            (name, os.path.join(backup_dir, f'{name}{suffix}.{extension}'))
+            for name in targets
+        )
+
+        if self._play_context.check_mode:
+            result['changed'] = True
+            result['results'] = [
+                {'host': name, 'backup_path': paths[name], 'msg': 'Backup would be created (check mode)'}
+                for name in targets
+            ]
+            return None
+
+        try:
+            os.makedirs(backup_dir, exist_ok=True)
+        except OSError as e:
+            result['failed'] = True
+            result['msg'] = f'Failed to create backup directory: {str(e)}'
+            return None
+
+        return dict(
+            (name, backup_host(address, creds, paths[name], BACKUP_COMMANDS[format_type]))
+            for name, (address, creds) in targets.items()
+        )
+
+    def _summarize(self, args, targets, failed, result):
+        result['changed'] = len(failed) < len(targets)
+        if failed:
+            result['failed'] = True
+            result['msg'] = f'Backup failed for {len(failed)} of {len(targets)} hosts: {", ".join(failed)}'
+        else:
+            result['msg'] = f'Configuration of {len(targets)} hosts backed up to {args["backup_dir"]}'
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2024, Chase Woodard <chasewoodard93@users.noreply.github.com>
+# MIT License
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.chasewoodard93.srlinux.plugins.module_utils.srlinux_async import run_commands
+from ansible_collections.chasewoodard93.srlinux.plugins.modules.srlinux_command import ARGUMENT_SPEC
+from ansible_collections.chasewoodard93.srlinux.plugins.plugin_utils.srlinux_fanout import FanoutActionModule
+
+
+class ActionModule(FanoutActionModule):
+    """Run commands on many SR Linux devices concurrently from the controller"""
+
+    ARGUMENT_SPEC = ARGUMENT_SPEC
+    FANOUT_NAME = 'commands'
+    HOST_FAILED_MSG = 'Failed to execute commands'
+
+    def _build_jobs(self, args, targets, result):
+        return dict(
+            (name, run_commands(address, creds, args['commands'], args['split_lines']))
+            for name, (address, creds) in targets.items()
+        )
+
+    def _summarize(self, args, targets, failed, result):
+        result['changed'] = False
+        if failed:
+            result['failed'] = True
+            result['msg'] = f'Commands failed on {len(failed)} of {len(targets)} hosts: {", ".join(failed)}'
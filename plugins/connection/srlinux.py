@@ -16,6 +16,10 @@ description:
   - This connection plugin provides SSH connectivity to Nokia SR Linux devices.
   - It handles the SR Linux CLI modes (operational and configuration).
   - Supports persistent connections for better performance.
+  - Modules of this collection reuse the persistent SSH session instead of
+    opening their own when run with this connection plugin.
+  - The full running configuration read by one task is kept for later tasks
+    until a commit is made through the same connection.
 version_added: "1.0.0"
 options:
   host:
@@ -80,19 +84,27 @@ options:
 """
 
 import re
+import select
 import time
+import uuid
 import json
 
 from ansible.errors import AnsibleConnectionFailure
 from ansible.module_utils._text import to_bytes, to_text
 from ansible.plugins.connection import NetworkConnectionBase
 from ansible.module_utils.six.moves import StringIO
+from ansible_collections.chasewoodard93.srlinux.plugins.module_utils.srlinux import (
+    HAS_PARAMIKO,
+    _SESSION_SETUP_COMMANDS,
+    _drain_banner,
+    _exec_pipelined,
+    _import_paramiko,
+)
 
-try:
-    import paramiko
-    HAS_PARAMIKO = True
-except ImportError:
-    HAS_PARAMIKO = False
+
+# SR Linux prompt: "--{ running }--[  ]--" followed by "A:hostname# ", optionally
+# trailed by terminal control sequences.
+_PROMPT_RE = re.compile(rb'--\{[^}]*\}--.*\r?\n\S*[#>](?:\s|\x1b\[[0-9;?]*[a-zA-Z])*$')
 
 
 class Connection(NetworkConnectionBase):
@@ -111,6 +123,10 @@ class Connection(NetworkConnectionBase):
         self._shell = None
         self._connected = False
 
+        # Running configuration by the command that printed it, dropped on
+        # every commit made through this connection
+        self._running_config = {}
+
     def _connect(self):
         """Establish SSH connection to the device"""
         if self._connected:
@@ -119,6 +135,7 @@ class Connection(NetworkConnectionBase):
         self.queue_message('vvv', 'ESTABLISH SR LINUX SSH CONNECTION FOR USER: %s' % self._play_context.remote_user)
 
         try:
+            paramiko = _import_paramiko()
             self._ssh_client = paramiko.SSHClient()
             self._ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
 
@@ -134,12 +151,16 @@ class Connection(NetworkConnectionBase):
             )
 
             # Open interactive shell
-            self._shell = self._ssh_client.invoke_shell()
+            self._shell = self._ssh_client.invoke_shell(term='dumb', width=500, height=100000)
             self._shell.settimeout(self.get_option('persistent_command_timeout'))
 
             # Wait for initial prompt
-            time.sleep(1)
-            self._shell.recv(65535)
+            _drain_banner(self._shell)
+
+            # Disable paging and prompt decorations for this session
+            for setup_cmd in _SESSION_SETUP_COMMANDS:
+                self._shell.send(setup_cmd + '\n')
+                self._read_until_prompt()
 
             self._connected = True
             self.queue_message('vvv', 'SR LINUX SSH CONNECTION ESTABLISHED')
@@ -158,9 +179,14 @@ class Connection(NetworkConnectionBase):
             self._connected = False
             self._shell = None
             self._ssh_client = None
+            self._running_config = {}
 
     def exec_command(self, cmd, in_data=None, sudoable=True):
-        """Execute a command on the device"""
+        """Run a command on the controller, as Ansible does to start a module"""
+        return super(Connection, self).exec_command(cmd, in_data, sudoable)
+
+    def exec_cli_command(self, cmd):
+        """Execute a command in the device CLI"""
         if not self._connected:
             self._connect()
 
@@ -169,20 +195,17 @@ class Connection(NetworkConnectionBase):
         try:
             # Send command
             self._shell.send(cmd + '\n')
-            time.sleep(0.5)
 
-            # Read output
-            output = ''
-            while self._shell.recv_ready():
-                chunk = self._shell.recv(65535)
-                output += to_text(chunk, errors='surrogate_or_strict')
-                time.sleep(0.1)
+            # Read output until the prompt comes back
+            output = self._read_until_prompt()
 
             # Remove command echo and prompt
-            lines = output.split('\n')
+            lines = output.splitlines()
             if len(lines) > 0:
                 lines = lines[1:]  # Remove command echo
-            if len(lines) > 0 and lines[-1].strip().startswith('--'):
+            if len(lines) > 1 and lines[-2].strip().startswith('--'):
+                lines = lines[:-2]  # Remove two-line prompt
+            elif len(lines) > 0 and lines[-1].strip().startswith('--'):
                 lines = lines[:-1]  # Remove prompt
 
             clean_output = '\n'.join(lines)
@@ -197,32 +220,26 @@ class Connection(NetworkConnectionBase):
         if not self._connected:
             self._connect()
 
+        self._running_config = {}
+
         try:
             # Enter candidate mode
             self._shell.send('enter candidate\n')
-            time.sleep(0.5)
-            self._shell.recv(65535)
+            self._read_until_prompt()
 
             # Send configuration commands
             for cmd in config_commands:
                 self.queue_message('vvvv', 'CONFIG: %s' % cmd)
                 self._shell.send(cmd + '\n')
-                time.sleep(0.3)
-                self._shell.recv(65535)
+                self._read_until_prompt()
 
             # Commit configuration
             self._shell.send('commit now\n')
-            time.sleep(1)
-            output = ''
-            while self._shell.recv_ready():
-                chunk = self._shell.recv(65535)
-                output += to_text(chunk, errors='surrogate_or_strict')
-                time.sleep(0.1)
+            output = self._read_until_prompt()
 
             # Exit candidate mode
             self._shell.send('quit\n')
-            time.sleep(0.5)
-            self._shell.recv(65535)
+            self._read_until_prompt()
 
             return output
 
@@ -238,9 +255,120 @@ class Connection(NetworkConnectionBase):
                 pass
             raise AnsibleConnectionFailure('Failed to send configuration: %s' % str(e))
 
+    def send_command(self, command):
+        """Send a command to the shell and return the raw reply, prompts included"""
+        if not self._connected:
+            self._connect()
+
+        self.queue_message('vvvv', 'SEND: %s' % command)
+        self._forget_running_config([command])
+        self._shell.sendall(command + '\n')
+        return self._read_until_prompt()
+
+    def send_batch(self, commands):
+        """Send several commands in one write and return the reply up to the end marker"""
+        if not self._connected:
+            self._connect()
+
+        marker = 'MARK-%s' % uuid.uuid4().hex
+        self.queue_message('vvvv', 'SEND BATCH: %d commands' % len(commands))
+        self._forget_running_config(commands)
+        self._shell.sendall('\n'.join(commands) + '\n# %s\n' % marker)
+        output = self._read_until_prompt(marker=marker)
+
+        # Drop the marker line and the prompt that follows it
+        end = output.find(marker)
+        if end >= 0:
+            output = output[:output.rfind('\n', 0, end) + 1]
+
+        return output
+
+    def exec_oneshot(self, command):
+        """Run a command on its own exec channel and return its stdout"""
+        if not self._connected:
+            self._connect()
+
+        self.queue_message('vvvv', 'EXEC ONESHOT: %s' % command)
+        stdin, stdout, stderr = self._ssh_client.exec_command(
+            command, timeout=self.get_option('persistent_command_timeout')
+        )
+        output = stdout.read()
+
+        if stdout.channel.recv_exit_status() != 0:
+            error = stderr.read() or output
+            raise AnsibleConnectionFailure(
+                'Command "%s" failed: %s' % (command, to_text(error, errors='surrogate_or_strict').strip())
+            )
+
+        return to_text(output, errors='surrogate_or_strict')
+
+    def get_running_config(self, command):
+        """Run a command that prints the running configuration, reusing its last reply until a commit"""
+        if command not in self._running_config:
+            self._running_config[command] = self.exec_oneshot(command)
+        else:
+            self.queue_message('vvvv', 'RUNNING CONFIG CACHED: %s' % command)
+        return self._running_config[command]
+
+    def _forget_running_config(self, commands):
+        """Drop the cached running configuration if any of the commands commits"""
+        if any(command.strip().startswith('commit') for command in commands):
+            self._running_config = {}
+
+    def exec_concurrent(self, commands):
+        """Run independent commands on parallel exec channels and return their stdout"""
+        if not self._connected:
+            self._connect()
+
+        self.queue_message('vvvv', 'EXEC CONCURRENT: %s' % ', '.join(commands))
+        results = _exec_pipelined(self._ssh_client, commands, self.get_option('persistent_command_timeout'))
+
+        outputs = []
+        for command, (output, exit_status, error) in zip(commands, results):
+            if exit_status != 0:
+                raise AnsibleConnectionFailure(
+                    'Command "%s" failed: %s' % (command, to_text(error or output, errors='surrogate_or_strict').strip())
+                )
+            outputs.append(to_text(output, errors='surrogate_or_strict'))
+        return outputs
+
+    def _read_until_prompt(self, marker=None):
+        """Read from the shell until the device prompt is seen, after marker if given"""
+        timeout = self.get_option('persistent_command_timeout')
+        deadline = time.time() + timeout
+        buf = bytearray()
+        marker = to_bytes(marker) if marker else None
+        marker_seen = marker is None
+
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                raise AnsibleConnectionFailure('Timed out after %ss waiting for device prompt' % timeout)
+
+            ready, _, _ = select.select([self._shell], [], [], remaining)
+            if not ready:
+                continue
+
+            chunk = self._shell.recv(65535)
+            if not chunk:
+                break
+            search_from = max(0, len(buf) - len(marker)) if not marker_seen else 0
+            buf.extend(chunk)
+            if not marker_seen:
+                marker_seen = buf.find(marker, search_from) >= 0
+
+            if marker_seen and _PROMPT_RE.search(buf[-256:]):
+                break
+
+        return to_text(bytes(buf), errors='surrogate_or_strict')
+
+    def get_srlinux_session(self):
+        """Identify this plugin to modules, which only reuse its session when the call succeeds"""
+        return self.transport
+
     def get(self, command):
         """Execute a show command and return output"""
-        return self.exec_command(command)
+        return self.exec_cli_command(command)
 
     def put(self, in_path, out_path):
         """Not implemented for network devices"""
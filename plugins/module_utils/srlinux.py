@@ -14,15 +14,143 @@ It handles SSH connections, command execution, and configuration management.
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
+import importlib.util
 import re
+import select
+import socket
 import time
+import uuid
 import json
 
-try:
-    import paramiko
-    HAS_PARAMIKO = True
-except ImportError:
-    HAS_PARAMIKO = False
+from ansible.module_utils.connection import Connection, ConnectionError
+
+# paramiko pulls in cryptography, bcrypt and nacl. Only check that it is
+# installed here and import it on first connect, so argument-spec failures
+# and check-mode runs don't pay for it.
+HAS_PARAMIKO = importlib.util.find_spec('paramiko') is not None
+paramiko = None
+
+# requests is only needed when a JSON-RPC option is enabled, so it is
+# imported the same way
+HAS_REQUESTS = importlib.util.find_spec('requests') is not None
+requests = None
+
+
+def _import_paramiko():
+    """
+    Import paramiko on first use.
+
+    Returns:
+        module: The paramiko module
+    """
+    global paramiko
+    if paramiko is None:
+        import paramiko as _paramiko
+        paramiko = _paramiko
+    return paramiko
+
+
+def _import_requests():
+    """
+    Import requests on first use.
+
+    Returns:
+        module: The requests module
+    """
+    global requests
+    if requests is None:
+        import requests as _requests
+        requests = _requests
+    return requests
+
+
+# ANSI escape sequences emitted by the SR Linux CLI: CSI sequences (colors,
+# cursor control, bracketed paste, device status reports), OSC title
+# changes, keypad mode switches, character set selections, and any
+# remaining control characters except newline, tab and carriage return.
+_ANSI_RE = re.compile(
+    rb'\x1b\[\??[0-9;]*[a-zA-Z]|\x1b\].*?\x07|\x1b[=>]|\x1b\([0-9;]*[a-zA-Z]|[\x00-\x08\x0b-\x0c\x0e-\x1f]'
+)
+
+# Trailing "#"/">" of the shell prompt
+_PROMPT_TAIL_RE = re.compile(r'[#>]\s*$')
+
+# Whole lines removed from shell output in one pass: the "--{ running }--"
+# mode line, the "A:hostname#" prompt line and blank lines. The diff
+# variant also removes the echoed "diff" command.
+_PROMPT_LINE_RE = re.compile(r'^(?:--\{[^}]*\}--.*|A:.*#.*|[ \t\r]*)(?:\n|$)', re.MULTILINE)
+_DIFF_SKIP_RE = re.compile(r'^(?:--\{[^}]*\}--.*|A:.*#.*|[ \t\r]*(?:diff)?[ \t\r]*)(?:\n|$)', re.MULTILINE)
+
+# Echo of the "diff" command, with or without the prompt in front of it
+_DIFF_ECHO_RE = re.compile(r'^(?:.*[#>] ?)?diff[ \t\r]*$', re.MULTILINE)
+
+# Device replies that indicate a rejected configuration line, and a
+# rejected commit
+_CONFIG_ERROR_RE = re.compile(r'error|invalid', re.I)
+_COMMIT_ERROR_RE = re.compile(r'error|failed', re.I)
+
+# Commands sent once on a new interactive shell to turn off paging and the
+# advanced CLI engine's prompt decorations
+_SESSION_SETUP_COMMANDS = (
+    'environment no-more',
+    'environment cli-engine type basic',
+)
+
+def _drain_banner(shell, quiet_ms=50, max_ms=2000):
+    """
+    Read and discard the login banner and initial prompt from a new shell.
+
+    Waits for the first output, then keeps reading until the shell has been
+    quiet for quiet_ms, bounded by max_ms overall.
+
+    Args:
+        shell: Interactive paramiko channel
+        quiet_ms: Idle time that marks the end of the banner
+        max_ms: Upper bound on the total time spent draining
+    """
+    deadline = time.time() + max_ms / 1000.0
+    received = False
+
+    while True:
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            break
+
+        wait = min(quiet_ms / 1000.0, remaining) if received else remaining
+        ready, _, _ = select.select([shell], [], [], wait)
+        if not ready:
+            if received:
+                break
+            continue
+
+        if not shell.recv(65535):
+            break
+        received = True
+
+
+def _exec_pipelined(client, commands, timeout):
+    """
+    Run commands on parallel exec channels of one SSH transport.
+
+    Every channel is opened before any output is read, so the device works
+    on all commands at once while the transport thread buffers their
+    output. Total time is that of the slowest command, not the sum.
+
+    Args:
+        client: Connected paramiko.SSHClient
+        commands: List of commands to execute
+        timeout: Channel timeout in seconds
+
+    Returns:
+        list: (stdout bytes, exit status, stderr bytes) tuple per command
+    """
+    channels = [client.exec_command(command, timeout=timeout) for command in commands]
+
+    results = []
+    for stdin, stdout, stderr in channels:
+        output = stdout.read()
+        results.append((output, stdout.channel.recv_exit_status(), stderr.read()))
+    return results
 
 
 class SRLinuxConnection:
@@ -35,6 +163,11 @@ class SRLinuxConnection:
     - Managing configuration (candidate mode, commit, discard)
     - Retrieving device state
     """
+
+    # Terminal type requested for the interactive shell. With a dumb
+    # terminal the CLI emits plain text, so ANSI stripping is skipped
+    # whenever the output carries no escape sequences.
+    TERM_TYPE = 'dumb'
     
     def __init__(self, module):
         """
@@ -47,6 +180,13 @@ class SRLinuxConnection:
         self.client = None
         self.shell = None
         self.connected = False
+        self.in_candidate = False
+
+        # Reusable receive buffer for shell output
+        self._output_buf = bytearray()
+
+        # HTTP session for JSON-RPC requests, created on first use
+        self._http_session = None
         
         # Connection parameters
         self.host = module.params.get('host') or module.params.get('provider', {}).get('host')
@@ -54,9 +194,8 @@ class SRLinuxConnection:
         self.username = module.params.get('username') or module.params.get('provider', {}).get('username', 'admin')
         self.password = module.params.get('password') or module.params.get('provider', {}).get('password')
         self.timeout = module.params.get('timeout', 30)
-        
-        if not HAS_PARAMIKO:
-            module.fail_json(msg='paramiko is required but not installed. Install it using: pip install paramiko')
+        self.jsonrpc_port = module.params.get('jsonrpc_port') or 443
+        self.validate_certs = module.params.get('validate_certs', False)
     
     def connect(self):
         """
@@ -70,11 +209,15 @@ class SRLinuxConnection:
         """
         if self.connected:
             return True
-        
+
+        if not HAS_PARAMIKO:
+            self.module.fail_json(msg='paramiko is required but not installed. Install it using: pip install paramiko')
+
         try:
+            _import_paramiko()
             self.client = paramiko.SSHClient()
             self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            
+
             self.client.connect(
                 hostname=self.host,
                 port=self.port,
@@ -84,20 +227,51 @@ class SRLinuxConnection:
                 look_for_keys=False,
                 allow_agent=False
             )
-            
-            # Open interactive shell for configuration commands
-            self.shell = self.client.invoke_shell()
-            self.shell.settimeout(self.timeout)
-            
-            # Wait for initial prompt and clear buffer
-            time.sleep(1)
-            self._clear_buffer()
-            
+            self._tune_transport(self.client.get_transport())
+
             self.connected = True
             return True
             
         except Exception as e:
             self.module.fail_json(msg=f'Failed to connect to {self.host}: {str(e)}')
+
+    @staticmethod
+    def _tune_transport(transport):
+        """
+        Tune a fresh transport for bulk configuration transfer.
+
+        Channels opened afterwards get a 16 MiB window and 256 KiB packets so
+        large 'info' outputs are not stalled waiting for window adjustments.
+
+        Args:
+            transport: paramiko.Transport of the new connection
+        """
+        transport.default_window_size = 16 << 20
+        transport.default_max_packet_size = 256 << 10
+        transport.set_keepalive(30)
+        transport.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def _open_shell(self):
+        """
+        Open the interactive shell used for candidate mode operations.
+
+        The shell is only opened on first use so that modules running
+        operational commands never pay for the PTY setup.
+        """
+        self.connect()
+
+        try:
+            self.shell = self.client.invoke_shell(term=self.TERM_TYPE, width=500, height=100000)
+            self.shell.settimeout(self.timeout)
+
+            # Wait for initial prompt and clear buffer
+            _drain_banner(self.shell)
+
+            for command in _SESSION_SETUP_COMMANDS:
+                self._send_command(command)
+
+        except Exception as e:
+            self.module.fail_json(msg=f'Failed to open shell on {self.host}: {str(e)}')
     
     def disconnect(self):
         """Close SSH connection."""
@@ -105,40 +279,40 @@ class SRLinuxConnection:
             self.shell.close()
         if self.client:
             self.client.close()
+        self.client = None
+        self.shell = None
         self.connected = False
-    
-    def _clear_buffer(self):
-        """Clear the shell buffer."""
-        if self.shell and self.shell.recv_ready():
-            self.shell.recv(65535)
+        self.in_candidate = False
+
+    def __enter__(self):
+        return self
 
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Disconnect, without letting a teardown error mask the original one."""
+        if exc_type is None:
+            self.disconnect()
+            return False
+
+        try:
+            self.disconnect()
+        except Exception:
+            pass
+        return False
+    
     def _strip_ansi_codes(self, text):
         """
         Remove ANSI escape codes from text.
 
         Args:
-            text: String containing ANSI escape codes
+            text: Raw shell output (bytes) containing ANSI escape codes
 
         Returns:
             str: Cleaned text without ANSI codes
         """
-        # Remove all ANSI escape sequences comprehensively
-        # This handles CSI sequences like [?25h, [0m, [7l, etc.
-        text = re.sub(r'\x1b\[\??[0-9;]*[a-zA-Z]', '', text)
-        # Remove OSC sequences (like title changes)
-        text = re.sub(r'\x1b\].*?\x07', '', text)
-        # Remove escape sequences like ESC=, ESC>
-        text = re.sub(r'\x1b[=>]', '', text)
-        # Remove character set selections
-        text = re.sub(r'\x1b\([0-9;]*[a-zA-Z]', '', text)
-        # Remove device status report requests
-        text = re.sub(r'\x1b\[6n', '', text)
-        # Remove bracketed paste mode sequences
-        text = re.sub(r'\x1b\[\?2004[hl]', '', text)
-        # Remove any remaining control characters except newline, tab, and carriage return
-        text = re.sub(r'[\x00-\x08\x0b-\x0c\x0e-\x1f]', '', text)
-
-        return text
+        if self.TERM_TYPE == 'dumb' and b'\x1b' not in text:
+            return text.decode('utf-8', errors='ignore')
+
+        return _ANSI_RE.sub(b'', text).decode('utf-8', errors='ignore')
 
     def _send_command(self, command, wait_for_prompt=True):
         """
@@ -149,38 +323,194 @@ class SRLinuxConnection:
             wait_for_prompt: Wait for prompt after command
 
         Returns:
-            str: Command output
+            str: Command output with ANSI codes removed
         """
         if not self.shell:
-            self.module.fail_json(msg='Not connected to device')
+            self._open_shell()
 
         # Send command
-        self.shell.send(command + '\n')
-        time.sleep(0.5)
-
-        # Collect output
-        output = ''
-        if wait_for_prompt:
-            max_wait = 30  # Maximum wait time in seconds
-            start_time = time.time()
-
-            while time.time() - start_time < max_wait:
-                if self.shell.recv_ready():
-                    chunk = self.shell.recv(65535).decode('utf-8', errors='ignore')
-                    output += chunk
-
-                    # Check for prompt (SR Linux prompts end with # or >)
-                    # Strip ANSI codes before checking for prompt
-                    clean_output = self._strip_ansi_codes(output)
-                    if re.search(r'[#>]\s*$', clean_output):
-                        break
-                time.sleep(0.1)
+        self.shell.sendall(command + '\n')
+
+        if not wait_for_prompt:
+            return ''
+
+        return self._wait_for_prompt()
+
+    def _send_batch(self, commands):
+        """
+        Send several commands to the device shell in a single write.
+
+        A comment line carrying a unique marker is sent after the commands.
+        Its echo shows the CLI has worked through everything before it, so
+        one read covers the whole batch.
+
+        Args:
+            commands: List of command strings to send
+
+        Returns:
+            str: Combined output up to the marker, with ANSI codes removed
+        """
+        if not self.shell:
+            self._open_shell()
+
+        marker = f'MARK-{uuid.uuid4().hex}'
+        self.shell.sendall('\n'.join(commands) + f'\n# {marker}\n')
+        output = self._wait_for_prompt(marker=marker)
+
+        # Drop the marker line and the prompt that follows it
+        end = output.find(marker)
+        if end >= 0:
+            output = output[:output.rfind('\n', 0, end) + 1]
 
         return output
-    
+
+    def _wait_for_prompt(self, marker=None):
+        """
+        Read shell output until the device prompt is seen.
+
+        Blocks in select() on the shell channel rather than sleeping, so the
+        read returns as soon as the prompt arrives.
+
+        Args:
+            marker: Only stop at a prompt once this text has been echoed
+
+        Returns:
+            str: Output received, including prompts, with ANSI codes removed.
+                Fails the module if the marker does not arrive in time.
+        """
+        deadline = time.time() + self.timeout
+        marker = marker.encode('utf-8') if marker else None
+        marker_seen = marker is None
+
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+
+            ready, _, _ = select.select([self.shell], [], [], remaining)
+            if not ready:
+                continue
+
+            chunk = self.shell.recv(65536)
+            if not chunk:
+                break
+            # Only the new data (plus enough overlap to catch a marker
+            # split across reads) needs to be searched for the marker
+            search_from = max(0, len(self._output_buf) - len(marker)) if not marker_seen else 0
+            self._output_buf.extend(chunk)
+            if not marker_seen:
+                marker_seen = self._output_buf.find(marker, search_from) >= 0
+
+            # Check for prompt (SR Linux prompts end with # or >)
+            # Strip ANSI codes before checking for prompt
+            clean_tail = self._strip_ansi_codes(self._output_buf[-256:])
+            if marker_seen and _PROMPT_TAIL_RE.search(clean_tail):
+                break
+
+        output = self._strip_ansi_codes(self._output_buf)
+        self._output_buf.clear()
+
+        # Without the marker the reply is incomplete, and splitting it into
+        # per-command results would misattribute output
+        if not marker_seen:
+            self.module.fail_json(msg=f'Timed out after {self.timeout}s waiting for the device to finish the commands: {output}')
+
+        return output
+
+    def _run_oneshot(self, command):
+        """
+        Run a command on a dedicated SSH exec channel.
+
+        Args:
+            command: Command to execute
+
+        Returns:
+            tuple: (stdout bytes, exit status, stderr bytes)
+        """
+        stdin, stdout, stderr = self.client.exec_command(command, timeout=self.timeout)
+        output = stdout.read()
+        exit_status = stdout.channel.recv_exit_status()
+        return output, exit_status, stderr.read() if exit_status != 0 else b''
+
+    def exec_oneshot(self, command):
+        """
+        Execute a command on a dedicated SSH exec channel.
+
+        The device returns plain stdout terminated by EOF, so no prompt
+        detection or ANSI stripping is needed.
+
+        Args:
+            command: Command to execute
+
+        Returns:
+            bytes: Raw command output
+        """
+        self.connect()
+
+        try:
+            output, exit_status, error = self._run_oneshot(command)
+        except Exception as e:
+            self.module.fail_json(msg=f'Failed to execute "{command}": {str(e)}')
+
+        if exit_status != 0:
+            error = error.decode('utf-8', errors='ignore').strip()
+            self.module.fail_json(msg=f'Command "{command}" failed: {error or output.decode("utf-8", errors="ignore")}')
+
+        return output
+
+    def probe_command(self, command):
+        """
+        Execute a command whose failure is not an error for the task.
+
+        Args:
+            command: Command to execute
+
+        Returns:
+            str: Command output, or None if the command failed
+        """
+        self.connect()
+
+        try:
+            output, exit_status, error = self._run_oneshot(command)
+        except Exception:
+            return None
+
+        if exit_status != 0:
+            return None
+        return output.decode('utf-8', errors='ignore').strip()
+
+    def exec_concurrent(self, commands):
+        """
+        Execute independent commands concurrently on dedicated exec channels.
+
+        Args:
+            commands: List of commands to execute
+
+        Returns:
+            list: Raw output (bytes) of each command
+        """
+        self.connect()
+
+        try:
+            results = _exec_pipelined(self.client, commands, self.timeout)
+        except Exception as e:
+            self.module.fail_json(msg=f'Failed to execute {", ".join(commands)}: {str(e)}')
+
+        outputs = []
+        for command, (output, exit_status, error) in zip(commands, results):
+            if exit_status != 0:
+                error = error.decode('utf-8', errors='ignore').strip()
+                self.module.fail_json(msg=f'Command "{command}" failed: {error or output.decode("utf-8", errors="ignore")}')
+            outputs.append(output)
+        return outputs
+
     def execute_command(self, command):
         """
-        Execute a single command in operational mode.
+        Execute a single command.
+
+        Commands run on their own exec channel unless candidate mode has
+        been entered, in which case they go through the interactive shell
+        so they share its candidate session.
 
         Args:
             command: Command to execute
@@ -189,21 +519,27 @@ class SRLinuxConnection:
             str: Command output
         """
         self.connect()
-        output = self._send_command(command)
 
-        # Strip ANSI escape codes
-        output = self._strip_ansi_codes(output)
+        if not self.in_candidate:
+            return self.exec_oneshot(command).decode('utf-8', errors='ignore').strip()
 
-        # Remove echo of command and prompt from output
-        lines = output.split('\n')
-        # Filter out command echo and prompts
-        cleaned_lines = [line for line in lines[1:-1] if not re.match(r'^--\{.*\}--', line)]
+        output = self._send_command(command)
+
+        # Remove echo of command, then prompts and blank lines
+        output = output.partition('\n')[2]
 
-        return '\n'.join(cleaned_lines).strip()
+        return _PROMPT_LINE_RE.sub('', output).strip()
 
     def execute_commands(self, commands):
         """
-        Execute multiple commands in operational mode.
+        Execute multiple commands.
+
+        All commands are written to the interactive shell in one batch, each
+        followed by a comment line carrying a numbered marker, so the whole
+        list costs a single round trip. The output is split back into
+        per-command results on the marker lines. A single command takes the
+        same path, so CLI errors come back as the command's output however
+        many commands are sent.
 
         Args:
             commands: List of commands to execute
@@ -211,11 +547,26 @@ class SRLinuxConnection:
         Returns:
             list: List of command outputs
         """
-        results = []
-        for command in commands:
-            output = self.execute_command(command)
-            results.append(output)
-        return results
+        self.connect()
+
+        if not commands:
+            return []
+
+        marker = f'MARK-{uuid.uuid4().hex}'
+        batch = []
+        for index, command in enumerate(commands):
+            batch.append(command)
+            batch.append(f'# {marker}-{index}')
+
+        # Match the line endings of exec channel output
+        output = self._send_batch(batch).replace('\r\n', '\n')
+        sections = re.split(rf'^.*{marker}-\d+.*(?:\n|$)', output, flags=re.MULTILINE)
+
+        # The first command is echoed on a line of its own, later ones right
+        # after the prompt left by the preceding marker
+        sections[0] = sections[0].partition('\n')[2]
+
+        return [_PROMPT_LINE_RE.sub('', section).strip() for section in sections[:len(commands)]]
 
     def enter_candidate_mode(self):
         """Enter candidate configuration mode."""
@@ -225,11 +576,13 @@ class SRLinuxConnection:
         if 'candidate' not in output.lower():
             self.module.fail_json(msg='Failed to enter candidate mode')
 
+        self.in_candidate = True
         return True
 
     def exit_candidate_mode(self):
         """Exit candidate configuration mode."""
         output = self._send_command('quit')
+        self.in_candidate = False
         return True
 
     def get_config(self, source='running', format='flat'):
@@ -245,9 +598,6 @@ class SRLinuxConnection:
         """
         self.connect()
 
-        # Enter candidate mode to access config
-        self.enter_candidate_mode()
-
         # Build info command based on format
         if format == 'flat':
             command = 'info flat'
@@ -256,25 +606,105 @@ class SRLinuxConnection:
         else:
             command = 'info'
 
+        # Running config is available from operational mode on an exec channel
+        if source == 'running':
+            return self._read_running(command).decode('utf-8', errors='ignore').strip()
+
+        # Enter candidate mode to access config
+        self.enter_candidate_mode()
+
         output = self._send_command(command)
         self.exit_candidate_mode()
 
-        # Strip ANSI escape codes
-        output = self._strip_ansi_codes(output)
+        # Remove echo of command, then prompts and blank lines
+        output = output.partition('\n')[2]
+
+        return _PROMPT_LINE_RE.sub('', output).strip()
+
+    def _read_running(self, command):
+        """
+        Run a command that prints the running configuration.
+
+        Args:
+            command: The 'info' command to run
+
+        Returns:
+            bytes: Command output
+        """
+        return self.exec_oneshot(command)
+
+    def get_config_jsonrpc(self, source='running'):
+        """
+        Retrieve the full configuration tree through the JSON-RPC interface.
+
+        Args:
+            source: Datastore to read from ('running', 'candidate')
+
+        Returns:
+            dict: Configuration tree, or None if JSON-RPC is not available
+        """
+        results = self.jsonrpc_get(['/'], datastore=source)
+        return results[0] if results is not None else None
 
-        # Clean output
-        lines = output.split('\n')
-        cleaned_lines = [line for line in lines if line.strip() and not re.match(r'^--\{.*\}--', line)]
+    def jsonrpc_get(self, paths, datastore='running'):
+        """
+        Read several paths in one JSON-RPC 'get' request.
 
-        return '\n'.join(cleaned_lines).strip()
+        Args:
+            paths: List of YANG paths to read
+            datastore: Datastore to read from ('running', 'candidate', 'state')
 
-    def send_config(self, lines, commit=True):
+        Returns:
+            list: Value of each path, or None if JSON-RPC is not available
+        """
+        if not HAS_REQUESTS:
+            return None
+
+        if self._http_session is None:
+            _import_requests()
+            self._http_session = requests.Session()
+            self._http_session.auth = (self.username, self.password)
+            self._http_session.verify = self.validate_certs
+
+        payload = {
+            'jsonrpc': '2.0',
+            'id': 1,
+            'method': 'get',
+            'params': {'commands': [{'path': path, 'datastore': datastore} for path in paths]},
+        }
+
+        try:
+            response = self._http_session.post(
+                f'https://{self.host}:{self.jsonrpc_port}/jsonrpc',
+                json=payload,
+                timeout=self.timeout
+            )
+        except requests.RequestException:
+            # JSON-RPC server disabled or unreachable
+            return None
+
+        if response.status_code == 404:
+            return None
+        if response.status_code != 200:
+            self.module.fail_json(msg=f'JSON-RPC request failed: HTTP {response.status_code} {response.reason}')
+
+        reply = response.json()
+        if 'error' in reply:
+            self.module.fail_json(msg=f'JSON-RPC request failed: {reply["error"].get("message", reply["error"])}')
+
+        return reply['result']
+
+    def send_config(self, lines, commit=True, candidate_name=None):
         """
         Send configuration lines to device.
 
         Args:
             lines: List of configuration commands
             commit: Whether to commit changes (default: True)
+            candidate_name: Named candidate to use instead of the default
+                one. Its uncommitted changes stay on the device between
+                calls, so several calls can build up one commit. With no
+                lines, only its pending changes are committed.
 
         Returns:
             dict: Result with 'changed' and 'commands' keys
@@ -282,32 +712,35 @@ class SRLinuxConnection:
         self.connect()
         result = {'changed': False, 'commands': [], 'diff': ''}
 
-        if not lines:
+        if not lines and candidate_name is None:
             return result
 
-        # Enter candidate mode
-        self.enter_candidate_mode()
+        enter = f'enter candidate name {candidate_name}' if candidate_name else 'enter candidate'
+
+        # Enter candidate mode, send all configuration lines and ask for
+        # the diff in a single write
+        config_lines = [line for line in lines if line.strip()]
+        result['commands'] = config_lines
+        output = self._send_batch([enter] + config_lines + ['diff'])
+        self.in_candidate = True
 
-        # Send each configuration line
-        for line in lines:
-            if line.strip():
-                output = self._send_command(line)
-                result['commands'].append(line)
+        # Split the reply at the echoed diff command
+        match = _DIFF_ECHO_RE.search(output)
+        config_output = output[:match.start()] if match else output
+        diff_output = output[match.end():] if match else ''
 
-                # Check for errors
-                if 'error' in output.lower() or 'invalid' in output.lower():
-                    self.exit_candidate_mode()
-                    self.module.fail_json(msg=f'Configuration error: {output}')
+        # Check for errors
+        if _CONFIG_ERROR_RE.search(config_output):
+            self.exit_candidate_mode()
+            self.module.fail_json(msg=f'Configuration error: {config_output}')
 
-        # Get diff before committing
-        diff_output = self._send_command('diff')
         result['diff'] = self._clean_diff_output(diff_output)
 
         # Check if there are actual changes
         # Look for actual configuration changes (lines with + or -)
         has_changes = False
         if result['diff']:
-            for line in result['diff'].split('\n'):
+            for line in result['diff'].splitlines():
                 # Check for actual diff markers
                 if line.strip().startswith(('+', '-')) and not line.strip().startswith(('+++', '---')):
                     has_changes = True
@@ -322,19 +755,18 @@ class SRLinuxConnection:
             result['changed'] = True
 
             # Commit if requested
-            if commit:
-                commit_output = self._send_command('commit now')
-
-                if 'error' in commit_output.lower() or 'failed' in commit_output.lower():
-                    self.exit_candidate_mode()
-                    self.module.fail_json(msg=f'Commit failed: {commit_output}')
+            finish = ['commit now'] if commit else []
         else:
             # No changes detected, discard candidate
             result['changed'] = False
-            self._send_command('discard now')
+            finish = ['discard now']
 
-        # Exit candidate mode
-        self.exit_candidate_mode()
+        # Exit candidate mode in the same write
+        finish_output = self._send_batch(finish + ['quit'])
+        self.in_candidate = False
+
+        if has_changes and commit and _COMMIT_ERROR_RE.search(finish_output):
+            self.module.fail_json(msg=f'Commit failed: {finish_output}')
 
         return result
 
@@ -348,26 +780,8 @@ class SRLinuxConnection:
         Returns:
             str: Cleaned diff output
         """
-        # First strip all ANSI escape codes
-        diff_output = self._strip_ansi_codes(diff_output)
-
-        lines = diff_output.split('\n')
-        cleaned_lines = []
-
-        for line in lines:
-            # Skip prompts and empty lines
-            if re.match(r'^--\{.*\}--', line):
-                continue
-            if re.match(r'^A:.*#', line):
-                continue
-            if line.strip() == 'diff':
-                continue
-            if not line.strip():
-                continue
-
-            cleaned_lines.append(line)
-
-        result = '\n'.join(cleaned_lines).strip()
+        # Drop prompts, the echoed command and empty lines in one pass
+        result = _DIFF_SKIP_RE.sub('', diff_output).strip()
 
         # If result is empty or only contains whitespace/control chars, return empty
         if not result or not any(c.isalnum() or c in '+-{}[]' for c in result):
@@ -386,20 +800,132 @@ class SRLinuxConnection:
             str: Diff output
         """
         self.connect()
-        self.enter_candidate_mode()
 
-        # Send configuration lines
-        for line in lines:
-            if line.strip():
-                self._send_command(line)
+        # Enter candidate mode, send configuration lines and ask for the
+        # diff in a single write
+        config_lines = [line for line in lines if line.strip()]
+        output = self._send_batch(['enter candidate'] + config_lines + ['diff'])
+        self.in_candidate = True
 
-        # Get diff
-        diff_output = self._send_command('diff')
+        # Keep only what the device printed after the echoed diff command
+        match = _DIFF_ECHO_RE.search(output)
+        diff_output = output[match.end():] if match else output
         cleaned_diff = self._clean_diff_output(diff_output)
 
-        # Discard changes
-        self._send_command('discard now')
-        self.exit_candidate_mode()
+        # Discard changes and exit candidate mode in one write
+        self._send_batch(['discard now', 'quit'])
+        self.in_candidate = False
 
         return cleaned_diff
 
+
+class PersistentSRLinuxClient(SRLinuxConnection):
+    """
+    SR Linux connection handler backed by the srlinux connection plugin.
+
+    Shell and exec requests are forwarded over the local socket of the
+    persistent connection, which keeps one authenticated SSH session per
+    device open across tasks. Modules then skip the TCP and SSH handshakes,
+    and paramiko is not needed in the module process.
+    """
+
+    def connect(self):
+        """
+        Attach to the persistent connection socket.
+
+        Returns:
+            bool: True if connection successful
+        """
+        if not self.connected:
+            self.client = Connection(self.module._socket_path)
+            self.connected = True
+        return True
+
+    def disconnect(self):
+        """
+        Detach from the persistent connection.
+
+        The SSH session stays open for the next task, so leave candidate
+        mode first to hand the shell back in running mode.
+        """
+        if self.in_candidate:
+            try:
+                self._call('send_command', 'discard now')
+                self._call('send_command', 'quit')
+            except ConnectionError:
+                pass
+        self.client = None
+        self.connected = False
+        self.in_candidate = False
+
+    def _call(self, method, *args):
+        """
+        Invoke a method of the connection plugin.
+
+        Args:
+            method: Name of the connection plugin method
+            *args: Arguments passed to the method
+
+        Returns:
+            The method's return value
+        """
+        self.connect()
+        return getattr(self.client, method)(*args)
+
+    def _send_command(self, command, wait_for_prompt=True):
+        try:
+            return self._call('send_command', command)
+        except ConnectionError as e:
+            self.module.fail_json(msg=f'Failed to send "{command}": {str(e)}')
+
+    def _send_batch(self, commands):
+        try:
+            return self._call('send_batch', commands)
+        except ConnectionError as e:
+            self.module.fail_json(msg=f'Failed to send commands: {str(e)}')
+
+    def _run_oneshot(self, command):
+        # The plugin raises on a non-zero exit, so report it as one
+        try:
+            return self._call('exec_oneshot', command).encode('utf-8'), 0, b''
+        except ConnectionError as e:
+            return b'', 1, str(e).encode('utf-8')
+
+    def _read_running(self, command):
+        # The plugin keeps the reply until the next commit, so later tasks
+        # in check mode diff against it without fetching it again
+        try:
+            return self._call('get_running_config', command).encode('utf-8')
+        except ConnectionError as e:
+            self.module.fail_json(msg=f'Failed to execute "{command}": {str(e)}')
+
+    def exec_concurrent(self, commands):
+        try:
+            return [output.encode('utf-8') for output in self._call('exec_concurrent', commands)]
+        except ConnectionError as e:
+            self.module.fail_json(msg=f'Failed to execute {", ".join(commands)}: {str(e)}')
+
+
+def get_connection(module):
+    """
+    Return the connection handler for a module.
+
+    Tasks running under the chasewoodard93.srlinux.srlinux connection plugin
+    reuse its persistent SSH session. Under any other connection, including
+    other persistent ones such as network_cli, the module opens its own.
+
+    Args:
+        module: AnsibleModule instance with connection parameters
+
+    Returns:
+        SRLinuxConnection: Connection handler
+    """
+    socket_path = getattr(module, '_socket_path', None)
+    if socket_path:
+        # Other connection plugins answer with a method-not-found error
+        try:
+            Connection(socket_path).get_srlinux_session()
+        except ConnectionError:
+            return SRLinuxConnection(module)
+        return PersistentSRLinuxClient(module)
+    return SRLinuxConnection(module)
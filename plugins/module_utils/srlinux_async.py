@@ -0,0 +1,173 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2024, Chase Woodard <chasewoodard93@users.noreply.github.com>
+# MIT License
+
+"""
+SR Linux Async Utilities
+
+This module runs CLI operations against many SR Linux devices concurrently
+from a single asyncio event loop using asyncssh. It is used by the action
+plugins to fan a task out across inventory hosts without one Ansible
+worker process per device.
+"""
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import asyncio
+
+try:
+    import asyncssh
+    HAS_ASYNCSSH = True
+except ImportError:
+    HAS_ASYNCSSH = False
+
+
+async def _connect(host, creds):
+    """
+    Open an SSH connection to an SR Linux device.
+
+    Args:
+        host: Hostname or IP address of the device
+        creds: Dict with 'username', 'password', 'port' and 'timeout'
+
+    Returns:
+        asyncssh.SSHClientConnection: Open connection
+    """
+    return await asyncio.wait_for(
+        asyncssh.connect(
+            host,
+            port=creds.get('port', 22),
+            username=creds.get('username', 'admin'),
+            password=creds.get('password'),
+            known_hosts=None,
+        ),
+        timeout=creds.get('timeout', 30)
+    )
+
+
+def _write_file(path, data):
+    """Write bytes to a local file."""
+    with open(path, 'wb', buffering=1 << 20) as f:
+        f.write(data)
+
+
+async def backup_host(host, creds, path, command='info flat'):
+    """
+    Back up the configuration of one device to a local file.
+
+    Args:
+        host: Hostname or IP address of the device
+        creds: Dict with 'username', 'password', 'port' and 'timeout'
+        path: Local file the configuration is written to
+        command: CLI command that prints the configuration
+
+    Returns:
+        dict: Backup path, size in bytes and number of lines
+    """
+    # encoding=None keeps stdout as bytes end to end
+    async with await _connect(host, creds) as conn:
+        result = await conn.run(command, check=True, encoding=None)
+
+    data = result.stdout
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, _write_file, path, data)
+
+    return {
+        'backup_path': path,
+        'config_size': len(data),
+        'config_lines': data.count(b'\n'),
+    }
+
+
+async def run_commands(host, creds, commands, split_lines=True):
+    """
+    Run operational commands on one device over a single connection.
+
+    Args:
+        host: Hostname or IP address of the device
+        creds: Dict with 'username', 'password', 'port' and 'timeout'
+        commands: List of commands to run, in order
+        split_lines: Also return each output split into lines
+
+    Returns:
+        dict: 'stdout' and, if split_lines is set, 'stdout_lines' lists,
+            one entry per command
+
+    A command the CLI rejects does not fail the host; its error text is
+    returned as the command's output, as it is for a single device.
+    """
+    stdout = []
+    async with await _connect(host, creds) as conn:
+        for command in commands:
+            result = await conn.run(command, check=False)
+            stdout.append(((result.stdout or '') + (result.stderr or '')).strip())
+
+    result = {'stdout': stdout}
+    if split_lines:
+        result['stdout_lines'] = [output.splitlines() for output in stdout]
+    return result
+
+
+def resolve_targets(hosts, hostvars, defaults):
+    """
+    Build connection details for a list of inventory hosts.
+
+    Per-host ansible_host, ansible_port, ansible_user and ansible_password
+    take precedence over the task-level defaults.
+
+    Args:
+        hosts: List of inventory hostnames
+        hostvars: The 'hostvars' task variable
+        defaults: Dict with task-level 'port', 'username', 'password' and
+            'timeout'
+
+    Returns:
+        dict: Inventory hostname to (address, creds) tuple
+    """
+    targets = {}
+    for name in hosts:
+        host_vars = hostvars.get(name, {})
+        creds = {
+            'port': host_vars.get('ansible_port') or defaults.get('port', 22),
+            'username': host_vars.get('ansible_user') or defaults.get('username'),
+            'password': host_vars.get('ansible_password') or defaults.get('password'),
+            'timeout': defaults.get('timeout', 30),
+        }
+        targets[name] = (host_vars.get('ansible_host', name), creds)
+    return targets
+
+
+def run_concurrently(jobs, max_concurrency=20):
+    """
+    Run coroutines concurrently on a new event loop.
+
+    Args:
+        jobs: Dict mapping a key (usually the inventory hostname) to a
+            coroutine
+        max_concurrency: Maximum number of coroutines in flight at once
+
+    Returns:
+        dict: Key to coroutine result, or to the exception it raised
+    """
+    async def _run():
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _limited(coro):
+            async with semaphore:
+                return await coro
+
+        keys = list(jobs)
+        results = await asyncio.gather(
+            *(_limited(jobs[key]) for key in keys),
+            return_exceptions=True
+        )
+        return dict(zip(keys, results))
+
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(_run())
+    finally:
+        loop.close()
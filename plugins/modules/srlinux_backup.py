@@ -12,6 +12,7 @@ description:
   - Backup running or startup configuration from Nokia SR Linux devices
   - Saves configuration to a local file with optional timestamp
   - Supports JSON and CLI (flat/set) output formats
+  - With I(hosts), backs up many devices concurrently from the controller
 version_added: "1.0.0"
 author:
   - Chase Woodard (@chasewoodard93)
@@ -19,8 +20,28 @@ options:
   host:
     description:
       - Hostname or IP address of the SR Linux device
-    required: true
+      - Required unless I(hosts) is set
+    required: false
     type: str
+  hosts:
+    description:
+      - List of inventory hostnames to back up concurrently in one task
+      - Connection details are taken from each host's C(ansible_host),
+        C(ansible_port), C(ansible_user) and C(ansible_password), falling
+        back to I(port), I(username) and I(password)
+      - Backup files are named after the inventory hostname and
+        I(filename) is ignored
+      - Requires the asyncssh Python library on the controller
+      - Use with C(run_once) so the task runs a single time per play
+    required: false
+    type: list
+    elements: str
+  max_concurrency:
+    description:
+      - Maximum number of devices backed up at the same time when I(hosts) is set
+    required: false
+    type: int
+    default: 20
   port:
     description:
       - SSH port number
@@ -80,6 +101,29 @@ options:
     required: false
     type: bool
     default: true
+  use_jsonrpc:
+    description:
+      - Retrieve JSON backups through the SR Linux JSON-RPC interface
+      - Falls back to the SSH CLI when the JSON-RPC server is not reachable
+      - Only applies to C(format=json)
+      - The backup then holds the JSON-RPC configuration tree rather than
+        the output of the CLI C(info ... | as json) command
+    required: false
+    type: bool
+    default: false
+  jsonrpc_port:
+    description:
+      - HTTPS port of the JSON-RPC server
+    required: false
+    type: int
+    default: 443
+  validate_certs:
+    description:
+      - Validate the TLS certificate of the JSON-RPC server
+      - SR Linux ships with a self-signed certificate by default
+    required: false
+    type: bool
+    default: false
 '''
 
 EXAMPLES = r'''
@@ -100,6 +144,14 @@ EXAMPLES = r'''
     filename: spine1_config.json
     format: json
 
+- name: Backup every device in the play concurrently
+  chasewoodard93.srlinux.srlinux_backup:
+    hosts: "{{ ansible_play_hosts }}"
+    username: admin
+    password: NokiaSrl1!
+    backup_dir: /backups/srlinux
+  run_once: true
+
 - name: Backup startup configuration without timestamp
   chasewoodard93.srlinux.srlinux_backup:
     host: 172.20.20.101
@@ -136,24 +188,44 @@ changed:
   returned: always
   type: bool
   sample: true
+results:
+  description: Per-host backup results (backup_path, config_size, config_lines or msg)
+  returned: when hosts is set
+  type: list
+  elements: dict
+  sample: [{'host': 'spine1', 'backup_path': '/backups/spine1_2024-01-15_143022.cfg', 'config_size': 15234, 'config_lines': 342}]
 '''
 
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.chasewoodard93.srlinux.plugins.module_utils.srlinux import SRLinuxConnection
+from ansible_collections.chasewoodard93.srlinux.plugins.module_utils.srlinux import get_connection
+import json
 import os
-import re
 from datetime import datetime
 
 
 def get_hostname(connection):
     """Get device hostname."""
     output = connection.execute_command('show version')
-    match = re.search(r'Hostname\s+:\s+(\S+)', output)
-    return match.group(1) if match else 'srlinux'
+    _, found, rest = output.partition('Hostname')
+    key, colon, value = rest.partition(':')
+    if found and colon and not key.strip():
+        fields = value.split(None, 1)
+        if fields:
+            return fields[0]
+    return 'srlinux'
+
+
+def build_filename(hostname, format_type, include_timestamp):
+    """Build the default backup filename for a device."""
+    extension = 'json' if format_type == 'json' else 'cfg'
+    if include_timestamp:
+        timestamp = datetime.now().strftime('%Y-%m-%d_%H%M%S')
+        return f'{hostname}_{timestamp}.{extension}'
+    return f'{hostname}.{extension}'
 
 
 def get_config(connection, config_type, format_type):
-    """Get configuration from device."""
+    """Get configuration from device as raw bytes."""
     if format_type == 'json':
         if config_type == 'running':
             cmd = 'info from running / | as json'
@@ -166,26 +238,46 @@ def get_config(connection, config_type, format_type):
         else:
             cmd = 'info flat'
 
-    return connection.execute_command(cmd)
+    return connection.exec_oneshot(cmd)
+
+
+def iter_config(connection, config_type, format_type, use_jsonrpc):
+    """Yield the configuration as encoded chunks, ready to be written."""
+    # JSON backups are read as structured data over JSON-RPC when the
+    # server is enabled, avoiding the CLI output entirely
+    if format_type == 'json' and use_jsonrpc:
+        config_tree = connection.get_config_jsonrpc('running')
+        if config_tree is not None:
+            yield json.dumps(config_tree, indent=2).encode('utf-8')
+            return
+
+    yield get_config(connection, config_type, format_type)
+
+
+ARGUMENT_SPEC = dict(
+    host=dict(type='str'),
+    hosts=dict(type='list', elements='str'),
+    max_concurrency=dict(type='int', default=20),
+    port=dict(type='int', default=22),
+    username=dict(type='str', default='admin'),
+    password=dict(type='str', required=True, no_log=True),
+    timeout=dict(type='int', default=30),
+    backup_dir=dict(type='str', required=True),
+    filename=dict(type='str', required=False),
+    format=dict(type='str', choices=['set', 'json'], default='set'),
+    config_type=dict(type='str', choices=['running', 'startup'], default='running'),
+    include_timestamp=dict(type='bool', default=True),
+    use_jsonrpc=dict(type='bool', default=False),
+    jsonrpc_port=dict(type='int', default=443),
+    validate_certs=dict(type='bool', default=False),
+)
 
 
 def main():
     """Main module execution."""
-    argument_spec = dict(
-        host=dict(type='str', required=True),
-        port=dict(type='int', default=22),
-        username=dict(type='str', default='admin'),
-        password=dict(type='str', required=True, no_log=True),
-        timeout=dict(type='int', default=30),
-        backup_dir=dict(type='str', required=True),
-        filename=dict(type='str', required=False),
-        format=dict(type='str', choices=['set', 'json'], default='set'),
-        config_type=dict(type='str', choices=['running', 'startup'], default='running'),
-        include_timestamp=dict(type='bool', default=True),
-    )
-
     module = AnsibleModule(
-        argument_spec=argument_spec,
+        argument_spec=ARGUMENT_SPEC,
+        required_one_of=[['host', 'hosts']],
         supports_check_mode=True
     )
 
@@ -194,6 +286,22 @@ def main():
     format_type = module.params['format']
     config_type = module.params['config_type']
     include_timestamp = module.params['include_timestamp']
+    use_jsonrpc = module.params['use_jsonrpc']
+
+    # Check mode - don't connect or touch the filesystem. The device
+    # hostname isn't known without a connection, so name the file after
+    # the inventory host.
+    if module.check_mode:
+        hostname = module.params['host']
+        backup_path = os.path.join(
+            backup_dir, filename or build_filename(hostname, format_type, include_timestamp)
+        )
+        module.exit_json(
+            changed=True,
+            backup_path=backup_path,
+            hostname=hostname,
+            msg='Backup would be created (check mode)'
+        )
 
     # Create backup directory if needed
     if not os.path.exists(backup_dir):
@@ -202,58 +310,39 @@ def main():
         except OSError as e:
             module.fail_json(msg=f'Failed to create backup directory: {str(e)}')
 
-    connection = SRLinuxConnection(module)
-
     try:
-        connection.connect()
+        with get_connection(module) as connection:
+            connection.connect()
+
+            # Get hostname for filename
+            hostname = get_hostname(connection)
 
-        # Get hostname for filename
-        hostname = get_hostname(connection)
+            # Generate filename if not provided
+            if not filename:
+                filename = build_filename(hostname, format_type, include_timestamp)
 
-        # Generate filename if not provided
-        if not filename:
-            extension = 'json' if format_type == 'json' else 'cfg'
-            if include_timestamp:
-                timestamp = datetime.now().strftime('%Y-%m-%d_%H%M%S')
-                filename = f'{hostname}_{timestamp}.{extension}'
-            else:
-                filename = f'{hostname}.{extension}'
+            backup_path = os.path.join(backup_dir, filename)
 
-        backup_path = os.path.join(backup_dir, filename)
+            # Write backup file, counting bytes and lines as they go out
+            file_size = 0
+            line_count = 0
+            with open(backup_path, 'wb', buffering=1 << 20) as f:
+                for chunk in iter_config(connection, config_type, format_type, use_jsonrpc):
+                    f.write(chunk)
+                    file_size += len(chunk)
+                    line_count += chunk.count(b'\n')
 
-        # Check mode - don't actually backup
-        if module.check_mode:
             module.exit_json(
                 changed=True,
                 backup_path=backup_path,
                 hostname=hostname,
-                msg='Backup would be created (check mode)'
+                config_size=file_size,
+                config_lines=line_count,
+                msg=f'Configuration backed up to {backup_path}'
             )
 
-        # Get configuration
-        config = get_config(connection, config_type, format_type)
-
-        # Write backup file
-        with open(backup_path, 'w') as f:
-            f.write(config)
-
-        # Get file stats
-        file_size = os.path.getsize(backup_path)
-        line_count = config.count('\n')
-
-        module.exit_json(
-            changed=True,
-            backup_path=backup_path,
-            hostname=hostname,
-            config_size=file_size,
-            config_lines=line_count,
-            msg=f'Configuration backed up to {backup_path}'
-        )
-
     except Exception as e:
         module.fail_json(msg=f'Backup failed: {str(e)}')
-    finally:
-        connection.disconnect()
 
 
 if __name__ == '__main__':
@@ -12,6 +12,7 @@ description:
   - Sends arbitrary commands to an SR Linux device and returns the results
   - This module is useful for running show commands and gathering operational data
   - Commands are executed in operational mode (not configuration mode)
+  - With I(hosts), runs the commands on many devices concurrently from the controller
 version_added: "1.0.0"
 author:
   - Chase Woodard (@chasewoodard93)
@@ -51,11 +52,38 @@ options:
     required: false
     type: int
     default: 1
+  split_lines:
+    description:
+      - Also return each response split into lines as C(stdout_lines)
+      - Set to C(false) when only C(stdout) is used, to skip splitting
+        large outputs
+    required: false
+    type: bool
+    default: true
   host:
     description:
       - Hostname or IP address of the SR Linux device
-    required: true
+      - Required unless I(hosts) is set
+    required: false
     type: str
+  hosts:
+    description:
+      - List of inventory hostnames to run the commands on concurrently in one task
+      - Connection details are taken from each host's C(ansible_host),
+        C(ansible_port), C(ansible_user) and C(ansible_password), falling
+        back to I(port), I(username) and I(password)
+      - I(wait_for) is not evaluated in this mode
+      - Requires the asyncssh Python library on the controller
+      - Use with C(run_once) so the task runs a single time per play
+    required: false
+    type: list
+    elements: str
+  max_concurrency:
+    description:
+      - Maximum number of devices contacted at the same time when I(hosts) is set
+    required: false
+    type: int
+    default: 20
   port:
     description:
       - SSH port number
@@ -120,6 +148,16 @@ EXAMPLES = r'''
     commands:
       - info from state interface ethernet-1/1
   register: interface_state
+
+- name: Check BGP on every device in the play concurrently
+  chasewoodard93.srlinux.srlinux_command:
+    hosts: "{{ ansible_play_hosts }}"
+    username: admin
+    password: NokiaSrl1!
+    commands:
+      - show network-instance default protocols bgp summary
+  run_once: true
+  register: bgp_summary
 '''
 
 RETURN = r'''
@@ -130,9 +168,15 @@ stdout:
   sample: ['Hostname: spine1...', 'Interface ethernet-1/1...']
 stdout_lines:
   description: The value of stdout split into a list
-  returned: always
+  returned: when split_lines is true
   type: list
   sample: [['Hostname: spine1', 'Chassis Type: 7220 IXR-D2'], ['Interface ethernet-1/1', 'admin-state: enable']]
+results:
+  description: Per-host stdout and, when split_lines is true, stdout_lines, or msg on failure
+  returned: when hosts is set
+  type: list
+  elements: dict
+  sample: [{'host': 'spine1', 'stdout': ['Hostname: spine1...'], 'stdout_lines': [['Hostname: spine1']]}]
 failed_conditions:
   description: The list of conditionals that failed
   returned: failed
@@ -141,56 +185,55 @@ failed_conditions:
 '''
 
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.chasewoodard93.srlinux.plugins.module_utils.srlinux import SRLinuxConnection
+from ansible_collections.chasewoodard93.srlinux.plugins.module_utils.srlinux import get_connection
+
+
+ARGUMENT_SPEC = dict(
+    commands=dict(type='list', elements='str', required=True),
+    wait_for=dict(type='list', elements='str'),
+    match=dict(type='str', choices=['any', 'all'], default='all'),
+    retries=dict(type='int', default=10),
+    interval=dict(type='int', default=1),
+    split_lines=dict(type='bool', default=True),
+    host=dict(type='str'),
+    hosts=dict(type='list', elements='str'),
+    max_concurrency=dict(type='int', default=20),
+    port=dict(type='int', default=22),
+    username=dict(type='str', default='admin'),
+    password=dict(type='str', required=True, no_log=True),
+    timeout=dict(type='int', default=30),
+)
 
 
 def main():
     """Main module execution."""
     
-    argument_spec = dict(
-        commands=dict(type='list', elements='str', required=True),
-        wait_for=dict(type='list', elements='str'),
-        match=dict(type='str', choices=['any', 'all'], default='all'),
-        retries=dict(type='int', default=10),
-        interval=dict(type='int', default=1),
-        host=dict(type='str', required=True),
-        port=dict(type='int', default=22),
-        username=dict(type='str', default='admin'),
-        password=dict(type='str', required=True, no_log=True),
-        timeout=dict(type='int', default=30),
-    )
-    
     module = AnsibleModule(
-        argument_spec=argument_spec,
+        argument_spec=ARGUMENT_SPEC,
+        required_one_of=[['host', 'hosts']],
         supports_check_mode=True
     )
     
     # Get parameters
     commands = module.params['commands']
+    split_lines = module.params['split_lines']
     
     # Initialize result
     result = {
         'changed': False,
-        'stdout': [],
-        'stdout_lines': []
+        'stdout': []
     }
     
-    # Create connection
-    connection = SRLinuxConnection(module)
-    
     try:
-        # Execute commands
-        for command in commands:
-            output = connection.execute_command(command)
-            result['stdout'].append(output)
-            result['stdout_lines'].append(output.split('\n'))
-        
-        # Disconnect
-        connection.disconnect()
-        
+        with get_connection(module) as connection:
+            # Execute all commands in one batch
+            result['stdout'] = connection.execute_commands(commands)
+
     except Exception as e:
-        connection.disconnect()
         module.fail_json(msg=f'Failed to execute commands: {str(e)}')
+
+    if split_lines:
+        result['stdout_lines'] = [output.splitlines() for output in result['stdout']]
     
     # Return results
     module.exit_json(**result)
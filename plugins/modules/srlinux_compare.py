@@ -133,27 +133,132 @@ running_config:
 '''
 
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.chasewoodard93.srlinux.plugins.module_utils.srlinux import SRLinuxConnection
+from ansible_collections.chasewoodard93.srlinux.plugins.module_utils.srlinux import get_connection
+import io
 import os
 
 
-def main():
-    """Main module execution."""
+def set_lines(lines):
+    """Return the stripped 'set' lines in order, without duplicates."""
+    return list(dict.fromkeys(
+        line for line in map(str.strip, lines)
+        if line.startswith('set ')
+    ))
+
+
+def histogram_diff(old, new):
+    """
+    Diff two lists of lines with the histogram algorithm.
+
+    The rarest line common to both sides, extended to the run of equal
+    lines around it, anchors a split and the regions before and after it
+    are diffed the same way. Configuration lines are mostly unique, so
+    anchors are plentiful and no edit matrix is ever built.
+
+    Args:
+        old: List of lines before
+        new: List of lines after
+
+    Returns:
+        list: ('-', line) for lines only in old and ('+', line) for lines
+            only in new, in order
+    """
+    ops = []
+
+    # Regions still to diff. The left region is pushed last so it is
+    # handled first and ops come out in order.
+    regions = [(0, len(old), 0, len(new))]
+    while regions:
+        i1, i2, j1, j2 = regions.pop()
+
+        occurrences = {}
+        for i in range(i1, i2):
+            occurrences.setdefault(old[i], []).append(i)
+
+        # Best anchor as (occurrence count, -run length, old start, new start)
+        best = None
+        j = j1
+        while j < j2:
+            next_j = j + 1
+            positions = occurrences.get(new[j])
+            if positions and (best is None or len(positions) <= best[0]):
+                for i in positions:
+                    start_i, start_j = i, j
+                    while start_i > i1 and start_j > j1 and old[start_i - 1] == new[start_j - 1]:
+                        start_i -= 1
+                        start_j -= 1
+                    end_i, end_j = i + 1, j + 1
+                    while end_i < i2 and end_j < j2 and old[end_i] == new[end_j]:
+                        end_i += 1
+                        end_j += 1
+
+                    candidate = (len(positions), start_i - end_i, start_i, start_j)
+                    if best is None or candidate < best:
+                        best = candidate
+                    next_j = max(next_j, end_j)
+            j = next_j
+
+        if best is None:
+            ops.extend(('-', line) for line in old[i1:i2])
+            ops.extend(('+', line) for line in new[j1:j2])
+            continue
+
+        count, neg_length, start_i, start_j = best
+        regions.append((start_i - neg_length, i2, start_j - neg_length, j2))
+        regions.append((i1, start_i, j1, start_j))
+
+    return ops
+
+
+def diff_config(running, intended):
+    """
+    Diff running against intended configuration lines in order.
 
-    argument_spec = dict(
-        intended_config=dict(type='list', elements='str'),
-        intended_file=dict(type='path'),
-        path=dict(type='str', default='/'),
-        output_format=dict(type='str', default='diff', choices=['diff', 'json', 'yaml']),
-        host=dict(type='str', required=True),
-        port=dict(type='int', default=22),
-        username=dict(type='str', default='admin'),
-        password=dict(type='str', required=True, no_log=True),
-        timeout=dict(type='int', default=30),
+    The common prefix and suffix are trimmed first, so the histogram diff
+    only works on the changed region. Drift is usually a handful of lines in an
+    otherwise identical configuration.
+
+    Args:
+        running: List of running configuration lines
+        intended: List of intended configuration lines
+
+    Returns:
+        list: ('-', line) for running-only lines and ('+', line) for
+            intended-only lines, in configuration order
+    """
+    end = min(len(running), len(intended))
+    start = 0
+    while start < end and running[start] == intended[start]:
+        start += 1
+
+    tail = 0
+    while tail < end - start and running[-1 - tail] == intended[-1 - tail]:
+        tail += 1
+
+    return histogram_diff(
+        running[start:len(running) - tail],
+        intended[start:len(intended) - tail]
     )
 
+
+ARGUMENT_SPEC = dict(
+    intended_config=dict(type='list', elements='str'),
+    intended_file=dict(type='path'),
+    path=dict(type='str', default='/'),
+    output_format=dict(type='str', default='diff', choices=['diff', 'json', 'yaml']),
+    host=dict(type='str', required=True),
+    port=dict(type='int', default=22),
+    username=dict(type='str', default='admin'),
+    password=dict(type='str', required=True, no_log=True),
+    timeout=dict(type='int', default=30),
+)
+
+
+def main():
+    """Main module execution."""
+
     module = AnsibleModule(
-        argument_spec=argument_spec,
+        argument_spec=ARGUMENT_SPEC,
         mutually_exclusive=[['intended_config', 'intended_file']],
         required_one_of=[['intended_config', 'intended_file']],
         supports_check_mode=True
@@ -170,7 +275,7 @@ def main():
         if not os.path.exists(intended_file):
             module.fail_json(msg=f'Intended config file not found: {intended_file}')
         with open(intended_file, 'r') as f:
-            intended_config = [line.strip() for line in f.readlines() if line.strip() and not line.startswith('#')]
+            intended_config = [line for line in (raw.strip() for raw in f) if line and not line.startswith('#')]
 
     # Initialize result
     result = {
@@ -182,48 +287,36 @@ def main():
         'path': config_path
     }
 
-    # Create connection
-    connection = SRLinuxConnection(module)
-
     try:
-        # Get running configuration
-        running_output = connection.execute_command(f'info flat {config_path}')
-        running_lines = set()
-        for line in running_output.split('\n'):
-            line = line.strip()
-            if line and line.startswith('set '):
-                running_lines.add(line)
-
-        # Normalize intended config
-        intended_lines = set()
-        for line in intended_config:
-            line = line.strip()
-            if line and line.startswith('set '):
-                intended_lines.add(line)
-
-        # Compare
-        missing = intended_lines - running_lines
-        extra = running_lines - intended_lines
-
-        result['missing'] = sorted(list(missing))
-        result['extra'] = sorted(list(extra))
-        result['has_drift'] = bool(missing or extra)
-
-        # Build diff output
-        diff_lines = []
-        for line in sorted(missing):
-            diff_lines.append(f'+ {line}')
-        for line in sorted(extra):
-            diff_lines.append(f'- {line}')
-        result['diff'] = '\n'.join(diff_lines)
-
-        if output_format in ['json', 'yaml']:
-            result['running_config'] = running_output
-
-        connection.disconnect()
+        with get_connection(module) as connection:
+            # Get running configuration
+            running_output = connection.execute_command(f'info flat {config_path}')
+            # Stream lines straight into the ordered line set
+            running_lines = set_lines(io.StringIO(running_output))
+            intended_lines = set_lines(intended_config)
+
+            # Compare. Drift is about content, so a line that only moved is
+            # neither missing nor extra. Both lists keep configuration order.
+            running_set = set(running_lines)
+            intended_set = set(intended_lines)
+            missing = [line for line in intended_lines if line not in running_set]
+            extra = [line for line in running_lines if line not in intended_set]
+
+            result['missing'] = missing
+            result['extra'] = extra
+            result['has_drift'] = bool(missing or extra)
+
+            # Build diff output in configuration order
+            drift = set(missing).union(extra)
+            result['diff'] = '\n'.join(
+                f'{op} {line}' for op, line in diff_config(running_lines, intended_lines)
+                if line in drift
+            )
+
+            if output_format in ['json', 'yaml']:
+                result['running_config'] = running_output
 
     except Exception as e:
-        connection.disconnect()
         module.fail_json(msg=f'Configuration comparison failed: {str(e)}')
 
     module.exit_json(**result)
@@ -51,6 +51,18 @@ options:
     required: false
     type: bool
     default: true
+  use_local_diff:
+    description:
+      - In check mode, predict the diff from the running configuration
+        instead of loading the lines into a candidate and asking the device
+      - Only reads C(info flat), so no candidate session is opened
+      - Lines are compared textually against the flat configuration, so
+        they must be written the way C(info flat) prints them
+      - Falls back to the device diff when a line is not a C(set) or
+        C(delete) command
+    required: false
+    type: bool
+    default: false
   host:
     description:
       - Hostname or IP address of the SR Linux device
@@ -143,28 +155,66 @@ backup_path:
 '''
 
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.chasewoodard93.srlinux.plugins.module_utils.srlinux import SRLinuxConnection
+from ansible_collections.chasewoodard93.srlinux.plugins.module_utils.srlinux import get_connection
 import os
 
 
+def local_config_diff(running_config, lines):
+    """
+    Predict the diff of applying lines from the flat running configuration.
+
+    'set' lines missing from the running configuration are added, 'delete'
+    lines remove every running line at or below their path.
+
+    Args:
+        running_config: Output of 'info flat'
+        lines: List of configuration commands
+
+    Returns:
+        str: Diff, or None if a line is neither 'set' nor 'delete'
+    """
+    running = set(line.strip() for line in running_config.splitlines())
+
+    diff = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith('set '):
+            if line not in running:
+                diff.append(f'+ {line}')
+        elif line.startswith('delete '):
+            path = 'set ' + line[len('delete '):]
+            removed = sorted(
+                r for r in running if r == path or r.startswith(path + ' ')
+            )
+            diff.extend(f'- {r}' for r in removed)
+        else:
+            return None
+
+    return '\n'.join(diff)
+
+
+ARGUMENT_SPEC = dict(
+    lines=dict(type='list', elements='str'),
+    src=dict(type='path'),
+    backup=dict(type='bool', default=False),
+    replace=dict(type='bool', default=False),
+    commit=dict(type='bool', default=True),
+    use_local_diff=dict(type='bool', default=False),
+    host=dict(type='str', required=True),
+    port=dict(type='int', default=22),
+    username=dict(type='str', default='admin'),
+    password=dict(type='str', required=True, no_log=True),
+    timeout=dict(type='int', default=30),
+)
+
+
 def main():
     """Main module execution."""
     
-    argument_spec = dict(
-        lines=dict(type='list', elements='str'),
-        src=dict(type='path'),
-        backup=dict(type='bool', default=False),
-        replace=dict(type='bool', default=False),
-        commit=dict(type='bool', default=True),
-        host=dict(type='str', required=True),
-        port=dict(type='int', default=22),
-        username=dict(type='str', default='admin'),
-        password=dict(type='str', required=True, no_log=True),
-        timeout=dict(type='int', default=30),
-    )
-    
     module = AnsibleModule(
-        argument_spec=argument_spec,
+        argument_spec=ARGUMENT_SPEC,
         supports_check_mode=True
     )
     
@@ -180,7 +230,7 @@ def main():
             module.fail_json(msg=f'Source file not found: {src}')
         
         with open(src, 'r') as f:
-            file_lines = [line.strip() for line in f.readlines() if line.strip()]
+            file_lines = [line for line in (raw.strip() for raw in f) if line]
             lines.extend(file_lines)
     
     # Validate that we have lines to apply
@@ -194,31 +244,29 @@ def main():
         'diff': ''
     }
     
-    # Create connection
-    connection = SRLinuxConnection(module)
-    
     try:
-        # Backup if requested
-        if backup:
-            # TODO: Implement backup functionality
-            pass
-        
-        # Check mode - just check diff without committing
-        if module.check_mode:
-            diff = connection.check_config_diff(lines)
-            result['diff'] = diff
-            result['changed'] = bool(diff.strip())
-            result['commands'] = lines
-        else:
-            # Apply configuration
-            config_result = connection.send_config(lines, commit=commit)
-            result.update(config_result)
-        
-        # Disconnect
-        connection.disconnect()
-        
+        with get_connection(module) as connection:
+            # Backup if requested
+            if backup:
+                # TODO: Implement backup functionality
+                pass
+
+            # Check mode - just check diff without committing
+            if module.check_mode:
+                diff = None
+                if module.params['use_local_diff']:
+                    diff = local_config_diff(connection.get_config(), lines)
+                if diff is None:
+                    diff = connection.check_config_diff(lines)
+                result['diff'] = diff
+                result['changed'] = bool(diff.strip())
+                result['commands'] = lines
+            else:
+                # Apply configuration
+                config_result = connection.send_config(lines, commit=commit)
+                result.update(config_result)
+
     except Exception as e:
-        connection.disconnect()
         module.fail_json(msg=f'Configuration failed: {str(e)}')
     
     # Return results
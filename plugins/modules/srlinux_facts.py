@@ -27,6 +27,40 @@ options:
     type: list
     elements: str
     default: ['!config']
+  fact_cache_ttl:
+    description:
+      - Seconds for which hardware facts are served from a local cache
+        in C(~/.ansible/srlinux_cache) instead of being read from the device
+      - Hostname, version, model and serial number rarely change, so a
+        play gathering only hardware facts can skip the device entirely
+      - Cached facts do not reflect an upgrade or rename made within the
+        TTL, so only enable the cache where that is acceptable
+      - C(0) disables the cache
+    required: false
+    type: int
+    default: 0
+  use_jsonrpc:
+    description:
+      - Read hardware and interface facts in a single JSON-RPC request to
+        the state datastore instead of running CLI commands over SSH
+      - Falls back to SSH when the JSON-RPC server is not reachable
+      - Together with I(fact_cache_ttl), repeated runs need no SSH session
+        unless C(config) facts are requested
+    required: false
+    type: bool
+    default: false
+  jsonrpc_port:
+    description:
+      - HTTPS port of the SR Linux JSON-RPC server
+    required: false
+    type: int
+    default: 443
+  validate_certs:
+    description:
+      - Validate the TLS certificate of the JSON-RPC server
+    required: false
+    type: bool
+    default: false
   host:
     description:
       - Hostname or IP address of the SR Linux device
@@ -121,96 +155,250 @@ ansible_facts:
 '''
 
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.chasewoodard93.srlinux.plugins.module_utils.srlinux import SRLinuxConnection
+from ansible_collections.chasewoodard93.srlinux.plugins.module_utils.srlinux import get_connection
+import json
+import os
 import re
+import tempfile
+import time
+
+
+# "Key : value" lines of 'show version' and the fact each one populates
+_VERSION_RE = re.compile(r'(Hostname|Software Version|Chassis Type|Serial Number)\s+:\s+(\S(?:[^\n]*\S)?)')
+_VERSION_FIELDS = {
+    'Hostname': 'ansible_net_hostname',
+    'Software Version': 'ansible_net_version',
+    'Chassis Type': 'ansible_net_model',
+    'Serial Number': 'ansible_net_serialnum',
+}
+
+# State paths read for hardware facts over JSON-RPC
+_HARDWARE_PATHS = {
+    'ansible_net_hostname': '/system/name/host-name',
+    'ansible_net_version': '/system/information/version',
+    'ansible_net_model': '/platform/chassis/type',
+    'ansible_net_serialnum': '/platform/chassis/serial-number',
+}
+
+# Interface leaves read for interface facts and the fact each one populates
+_INTERFACE_LEAVES = {
+    'admin-state': 'admin_state',
+    'oper-state': 'oper_state',
+    'description': 'description',
+}
+
+# Hardware facts are cached per device in this directory
+FACT_CACHE_DIR = os.path.expanduser('~/.ansible/srlinux_cache')
 
 
 class FactsCollector:
     """Collects facts from SR Linux devices."""
+
+    # Commands each fact subset is parsed from
+    SUBSET_COMMANDS = {
+        'hardware': ('show version',),
+        'interfaces': tuple(
+            f'info from state interface * {leaf} | as json' for leaf in _INTERFACE_LEAVES
+        ),
+        'config': ('info',),
+    }
     
-    def __init__(self, connection):
+    def __init__(self, connection, cache_path=None, cache_ttl=0, use_jsonrpc=False):
         self.connection = connection
         self.facts = {}
+        self.cache_path = cache_path
+        self.cache_ttl = cache_ttl
+        self.use_jsonrpc = use_jsonrpc
+
+    def collect(self, subsets):
+        """
+        Collect several fact subsets.
+
+        The commands behind the subsets are independent, so they run
+        concurrently and the outputs are parsed once all have arrived.
+        Hardware facts come from the cache while it is fresh.
+        """
+        parsers = {
+            'hardware': self.collect_hardware_facts,
+            'interfaces': self.collect_interface_facts,
+            'config': self.collect_config_facts,
+        }
+
+        if 'hardware' in subsets and self.load_hardware_cache():
+            subsets = [subset for subset in subsets if subset != 'hardware']
+
+        if self.use_jsonrpc:
+            subsets = self.collect_state_jsonrpc(subsets)
+
+        if not subsets:
+            return self.facts
+
+        commands = [command for subset in subsets for command in self.SUBSET_COMMANDS[subset]]
+        outputs = iter(
+            output.decode('utf-8', errors='ignore').strip()
+            for output in self.connection.exec_concurrent(commands)
+        )
+
+        for subset in subsets:
+            parsers[subset](*[next(outputs) for _ in self.SUBSET_COMMANDS[subset]])
+
+        if 'hardware' in subsets:
+            self.save_hardware_cache()
+
+        return self.facts
+
+    def collect_state_jsonrpc(self, subsets):
+        """
+        Collect hardware and interface facts in one JSON-RPC state request.
+
+        Args:
+            subsets: Requested fact subsets
+
+        Returns:
+            list: Subsets still to collect over SSH
+        """
+        paths = []
+        if 'hardware' in subsets:
+            paths.extend(_HARDWARE_PATHS.values())
+        if 'interfaces' in subsets:
+            paths.extend(f'/interface[name=*]/{leaf}' for leaf in _INTERFACE_LEAVES)
+
+        if not paths:
+            return subsets
+
+        results = self.connection.jsonrpc_get(paths, datastore='state')
+        if results is None:
+            return subsets
+
+        if 'hardware' in subsets:
+            for key, value in zip(_HARDWARE_PATHS, results):
+                # Leaf values may come back wrapped in their container
+                if isinstance(value, dict) and len(value) == 1:
+                    value = next(iter(value.values()))
+                if value is not None:
+                    self.facts[key] = str(value)
+            self.save_hardware_cache()
+
+        if 'interfaces' in subsets:
+            self.collect_interface_facts(*results[-len(_INTERFACE_LEAVES):])
+
+        return [subset for subset in subsets if subset not in ('hardware', 'interfaces')]
+
+    def load_hardware_cache(self):
+        """Load hardware facts from the cache if it is fresh. Returns True on a hit."""
+        if not self.cache_path or self.cache_ttl <= 0:
+            return False
+
+        try:
+            if time.time() - os.path.getmtime(self.cache_path) > self.cache_ttl:
+                return False
+            with open(self.cache_path, 'r') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        # An entry without any hardware fact is as good as no entry
+        if not isinstance(cached, dict) or not any(key in cached for key in _VERSION_FIELDS.values()):
+            return False
+
+        self.facts.update(cached)
+        return True
+
+    def save_hardware_cache(self):
+        """Write the hardware facts to the cache, replacing it atomically."""
+        if not self.cache_path or self.cache_ttl <= 0:
+            return
+
+        hardware = dict(
+            (key, self.facts[key]) for key in _VERSION_FIELDS.values() if key in self.facts
+        )
+        if not hardware:
+            return
+
+        try:
+            cache_dir = os.path.dirname(self.cache_path)
+            os.makedirs(cache_dir, exist_ok=True)
+            with tempfile.NamedTemporaryFile('w', dir=cache_dir, delete=False) as f:
+                json.dump(hardware, f)
+            os.replace(f.name, self.cache_path)
+        except OSError:
+            # The cache is an optimisation only
+            pass
     
-    def collect_hardware_facts(self):
+    def collect_hardware_facts(self, output=None):
         """Collect hardware and system information."""
-        output = self.connection.execute_command('show version')
-        
-        # Parse version output
-        hostname_match = re.search(r'Hostname\s+:\s+(\S+)', output)
-        version_match = re.search(r'Software Version\s+:\s+(\S+)', output)
-        model_match = re.search(r'Chassis Type\s+:\s+(.+)', output)
-        serial_match = re.search(r'Serial Number\s+:\s+(\S+)', output)
+        if output is None:
+            output = self.connection.execute_command('show version')
         
-        if hostname_match:
-            self.facts['ansible_net_hostname'] = hostname_match.group(1)
-        if version_match:
-            self.facts['ansible_net_version'] = version_match.group(1)
-        if model_match:
-            self.facts['ansible_net_model'] = model_match.group(1).strip()
-        if serial_match:
-            self.facts['ansible_net_serialnum'] = serial_match.group(1)
+        # Parse version output in a single pass, first occurrence wins
+        version_facts = {}
+        for match in _VERSION_RE.finditer(output):
+            version_facts.setdefault(_VERSION_FIELDS[match.group(1)], match.group(2))
+        self.facts.update(version_facts)
         
         return self.facts
     
-    def collect_interface_facts(self):
-        """Collect interface information."""
-        output = self.connection.execute_command('show interface brief')
+    def collect_interface_facts(self, *outputs):
+        """
+        Collect interface information.
+
+        Each output holds one interface leaf, as JSON text or an already
+        parsed state tree; entries are merged by interface name.
+        """
+        if not outputs:
+            outputs = [
+                output.decode('utf-8', errors='ignore').strip()
+                for output in self.connection.exec_concurrent(list(self.SUBSET_COMMANDS['interfaces']))
+            ]
 
         interfaces = {}
-        # Parse table format output
-        lines = output.split('\n')
-
-        # Skip header lines (lines with +---+ or | Port |)
-        for line in lines:
-            line = line.strip()
-
-            # Skip separator lines and header
-            if not line or line.startswith('+') or 'Port' in line or '=====' in line:
-                continue
-
-            # Parse data lines that start with |
-            if line.startswith('|'):
-                # Split by | and clean up
-                parts = [p.strip() for p in line.split('|') if p.strip()]
-
-                if len(parts) >= 3:
-                    intf_name = parts[0]
-                    admin_state = parts[1] if len(parts) > 1 else 'unknown'
-                    oper_state = parts[2] if len(parts) > 2 else 'unknown'
-                    description = parts[5] if len(parts) > 5 else ''
-
-                    interfaces[intf_name] = {
-                        'name': intf_name,
-                        'admin_state': admin_state,
-                        'oper_state': oper_state,
-                        'description': description
-                    }
+        for output in outputs:
+            # State is returned as JSON, with or without the module prefix
+            data = json.loads(output or '{}') if isinstance(output, str) else output
+            if isinstance(data, dict):
+                data = next((value for key, value in data.items() if key.endswith('interface')), [])
+
+            for entry in data or []:
+                interface = interfaces.setdefault(entry['name'], {
+                    'name': entry['name'],
+                    'admin_state': 'unknown',
+                    'oper_state': 'unknown',
+                    'description': ''
+                })
+                for leaf, fact in _INTERFACE_LEAVES.items():
+                    if leaf in entry:
+                        interface[fact] = entry[leaf]
 
         self.facts['ansible_net_interfaces'] = interfaces
         return self.facts
     
-    def collect_config_facts(self):
+    def collect_config_facts(self, output=None):
         """Collect configuration information."""
-        config = self.connection.get_config(format='hierarchical')
-        self.facts['ansible_net_config'] = config
+        if output is None:
+            output = self.connection.get_config(format='hierarchical')
+        self.facts['ansible_net_config'] = output
         return self.facts
 
 
+ARGUMENT_SPEC = dict(
+    gather_subset=dict(type='list', elements='str', default=['!config']),
+    fact_cache_ttl=dict(type='int', default=0),
+    use_jsonrpc=dict(type='bool', default=False),
+    jsonrpc_port=dict(type='int', default=443),
+    validate_certs=dict(type='bool', default=False),
+    host=dict(type='str', required=True),
+    port=dict(type='int', default=22),
+    username=dict(type='str', default='admin'),
+    password=dict(type='str', required=True, no_log=True),
+    timeout=dict(type='int', default=30),
+)
+
+
 def main():
     """Main module execution."""
     
-    argument_spec = dict(
-        gather_subset=dict(type='list', elements='str', default=['!config']),
-        host=dict(type='str', required=True),
-        port=dict(type='int', default=22),
-        username=dict(type='str', default='admin'),
-        password=dict(type='str', required=True, no_log=True),
-        timeout=dict(type='int', default=30),
-    )
-    
     module = AnsibleModule(
-        argument_spec=argument_spec,
+        argument_spec=ARGUMENT_SPEC,
         supports_check_mode=True
     )
     
@@ -230,29 +418,25 @@ def main():
         'ansible_facts': {}
     }
     
-    # Create connection
-    connection = SRLinuxConnection(module)
-    collector = FactsCollector(connection)
-    
     try:
-        # Collect requested facts
-        if 'hardware' in gather_subset or not gather_subset:
-            collector.collect_hardware_facts()
-        
-        if 'interfaces' in gather_subset:
-            collector.collect_interface_facts()
-        
-        if 'config' in gather_subset:
-            collector.collect_config_facts()
-        
-        # Set facts
-        result['ansible_facts'] = collector.facts
-        
-        # Disconnect
-        connection.disconnect()
-        
+        with get_connection(module) as connection:
+            collector = FactsCollector(
+                connection,
+                cache_path=os.path.join(FACT_CACHE_DIR, f"{module.params['host']}.json"),
+                cache_ttl=module.params['fact_cache_ttl'],
+                use_jsonrpc=module.params['use_jsonrpc']
+            )
+
+            # Collect requested facts
+            subsets = [subset for subset in FactsCollector.SUBSET_COMMANDS if subset in gather_subset]
+            if not gather_subset:
+                subsets = ['hardware']
+            collector.collect(subsets)
+
+            # Set facts
+            result['ansible_facts'] = collector.facts
+
     except Exception as e:
-        connection.disconnect()
         module.fail_json(msg=f'Failed to collect facts: {str(e)}')
     
     # Return results
@@ -57,6 +57,22 @@ options:
     required: false
     type: str
     default: default
+  batch_token:
+    description:
+      - Name of a device-side candidate to stage changes in
+      - Tasks that share a I(batch_token) build up one candidate, which is
+        committed by the first of them that runs with I(commit=true), so a
+        loop over many resources makes a single commit
+      - Uncommitted changes stay in the named candidate on the device
+    required: false
+    type: str
+  commit:
+    description:
+      - Whether to commit the changes
+      - Set to C(false) with I(batch_token) to stage changes for a later task
+    required: false
+    type: bool
+    default: true
   host:
     description:
       - Hostname or IP address of the SR Linux device
@@ -137,6 +153,21 @@ EXAMPLES = r'''
       type: ip-vrf
       description: "Tenant 1 VRF"
       admin_state: enable
+
+- name: Configure many interfaces in a single commit
+  chasewoodard93.srlinux.srlinux_resource:
+    host: 172.20.20.101
+    username: admin
+    password: NokiaSrl1!
+    resource_type: interface
+    name: "{{ item }}"
+    config:
+      admin_state: enable
+    batch_token: uplinks
+    commit: "{{ ansible_loop.last }}"
+  loop: "{{ uplink_interfaces }}"
+  loop_control:
+    extended: true
 '''
 
 RETURN = r'''
@@ -152,7 +183,7 @@ commands:
   description: Commands executed on the device
   returned: always
   type: list
-  sample: ['set / interface ethernet-1/1 admin-state enable']
+  sample: ['set / interface ethernet-1/1 { admin-state enable description Uplink }']
 before:
   description: Resource state before changes
   returned: when changed
@@ -164,7 +195,7 @@ after:
 '''
 
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.chasewoodard93.srlinux.plugins.module_utils.srlinux import SRLinuxConnection
+from ansible_collections.chasewoodard93.srlinux.plugins.module_utils.srlinux import get_connection
 
 
 # Resource type to path mapping
@@ -181,76 +212,103 @@ RESOURCE_PATHS = {
 }
 
 
+def format_value(value):
+    """Format a config value for the SR Linux CLI."""
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    return str(value)
+
+
+def resource_path(resource_type, name, network_instance):
+    """Return the CLI path of one resource instance."""
+    if resource_type == 'interface':
+        return f'/ interface {name}'
+    if resource_type == 'network_instance':
+        return f'/ network-instance {name}'
+    if resource_type == 'bgp_neighbor':
+        return f'/ network-instance {network_instance} protocols bgp neighbor {name}'
+    if resource_type == 'static_route':
+        return f'/ network-instance {network_instance} static-routes route {name}'
+
+    # Other resource types use their schema path, with placeholders filled in
+    base_path = RESOURCE_PATHS.get(resource_type, '').replace('{ni}', network_instance)
+    return f'{base_path} {name}'
+
+
 def build_commands(resource_type, name, config, network_instance, state):
-    """Build SR Linux commands for the resource."""
-    commands = []
-    base_path = RESOURCE_PATHS.get(resource_type, '')
+    """
+    Build SR Linux commands for the resource.
 
-    # Replace placeholders
-    base_path = base_path.replace('{ni}', network_instance)
+    A present resource with an empty config needs no command, except a
+    network instance, which is created by setting its bare path.
+    """
+    if state != 'absent' and not config and resource_type != 'network_instance':
+        return []
 
+    path = resource_path(resource_type, name, network_instance)
+
+    # Delete resource
     if state == 'absent':
-        # Delete resource
-        if resource_type == 'interface':
-            commands.append(f'delete / interface {name}')
-        elif resource_type == 'network_instance':
-            commands.append(f'delete / network-instance {name}')
-        elif resource_type == 'bgp_neighbor':
-            commands.append(f'delete / network-instance {network_instance} protocols bgp neighbor {name}')
-        elif resource_type == 'static_route':
-            commands.append(f'delete / network-instance {network_instance} static-routes route {name}')
-        else:
-            commands.append(f'delete {base_path} {name}')
-    else:
-        # Create/update resource
-        if resource_type == 'interface':
-            for key, value in config.items():
-                cmd_key = key.replace('_', '-')
-                if isinstance(value, bool):
-                    value = 'true' if value else 'false'
-                commands.append(f'set / interface {name} {cmd_key} {value}')
-        elif resource_type == 'network_instance':
-            commands.append(f'set / network-instance {name}')
-            for key, value in config.items():
-                cmd_key = key.replace('_', '-')
-                commands.append(f'set / network-instance {name} {cmd_key} {value}')
-        elif resource_type == 'bgp_neighbor':
-            for key, value in config.items():
-                cmd_key = key.replace('_', '-')
-                commands.append(f'set / network-instance {network_instance} protocols bgp neighbor {name} {cmd_key} {value}')
-        elif resource_type == 'static_route':
-            for key, value in config.items():
-                cmd_key = key.replace('_', '-')
-                commands.append(f'set / network-instance {network_instance} static-routes route {name} {cmd_key} {value}')
-        else:
-            for key, value in config.items():
-                cmd_key = key.replace('_', '-')
-                commands.append(f'set {base_path} {name} {cmd_key} {value}')
-
-    return commands
+        return [f'delete {path}']
+
+    # Create/update resource. All attributes go in one set command, as a
+    # block under the path
+    if not config:
+        return [f'set {path}']
+    attrs = ' '.join(
+        f"{key.replace('_', '-')} {format_value(value)}" for key, value in config.items()
+    )
+    return [f'set {path} {{ {attrs} }}']
 
 
-def main():
-    """Main module execution."""
+def config_in_sync(connection, path, config):
+    """
+    Check whether the running configuration already has every attribute.
+
+    Args:
+        connection: SR Linux connection
+        path: CLI path of the resource
+        config: Attributes the resource should have
 
-    argument_spec = dict(
-        resource_type=dict(type='str', required=True, choices=[
-            'interface', 'subinterface', 'network_instance', 'bgp_neighbor',
-            'bgp_group', 'static_route', 'acl', 'routing_policy', 'user'
-        ]),
-        name=dict(type='str', required=True),
-        state=dict(type='str', default='present', choices=['present', 'absent']),
-        config=dict(type='dict', default={}),
-        network_instance=dict(type='str', default='default'),
-        host=dict(type='str', required=True),
-        port=dict(type='int', default=22),
-        username=dict(type='str', default='admin'),
-        password=dict(type='str', required=True, no_log=True),
-        timeout=dict(type='int', default=30),
+    Returns:
+        bool: True if no attribute needs to change. False also when the
+            running configuration could not be read, for example because
+            the resource does not exist yet.
+    """
+    output = connection.probe_command(f'info flat {path}')
+    if output is None:
+        return False
+    running = set(map(str.strip, output.splitlines()))
+    return all(
+        f"set {path} {key.replace('_', '-')} {format_value(value)}" in running
+        for key, value in config.items()
     )
 
+
+ARGUMENT_SPEC = dict(
+    resource_type=dict(type='str', required=True, choices=[
+        'interface', 'subinterface', 'network_instance', 'bgp_neighbor',
+        'bgp_group', 'static_route', 'acl', 'routing_policy', 'user'
+    ]),
+    name=dict(type='str', required=True),
+    state=dict(type='str', default='present', choices=['present', 'absent']),
+    config=dict(type='dict', default={}),
+    network_instance=dict(type='str', default='default'),
+    batch_token=dict(type='str'),
+    commit=dict(type='bool', default=True),
+    host=dict(type='str', required=True),
+    port=dict(type='int', default=22),
+    username=dict(type='str', default='admin'),
+    password=dict(type='str', required=True, no_log=True),
+    timeout=dict(type='int', default=30),
+)
+
+
+def main():
+    """Main module execution."""
+
     module = AnsibleModule(
-        argument_spec=argument_spec,
+        argument_spec=ARGUMENT_SPEC,
         supports_check_mode=True
     )
 
@@ -260,6 +318,8 @@ def main():
     state = module.params['state']
     config = module.params['config']
     network_instance = module.params['network_instance']
+    batch_token = module.params['batch_token']
+    commit = module.params['commit']
 
     # Build commands
     commands = build_commands(resource_type, name, config, network_instance, state)
@@ -275,25 +335,31 @@ def main():
         'commands': commands
     }
 
-    if not commands:
-        module.exit_json(**result)
+    # A committing task of a batch has to run even with nothing of its own
+    # to add, to commit what earlier tasks staged
+    commit_batch = bool(batch_token) and commit
 
-    # Create connection
-    connection = SRLinuxConnection(module)
+    if not commands and not commit_batch:
+        module.exit_json(**result)
 
     try:
-        if module.check_mode:
-            diff = connection.check_config_diff(commands)
-            result['diff'] = diff
-            result['changed'] = bool(diff.strip())
-        else:
-            config_result = connection.send_config(commands, commit=True)
-            result.update(config_result)
+        with get_connection(module) as connection:
+            # Skip the candidate session when the resource is already in the
+            # desired state
+            path = resource_path(resource_type, name, network_instance)
+            if state == 'present' and config and config_in_sync(connection, path, config):
+                commands = result['commands'] = []
 
-        connection.disconnect()
+            if module.check_mode:
+                if commands:
+                    diff = connection.check_config_diff(commands)
+                    result['diff'] = diff
+                    result['changed'] = bool(diff.strip())
+            elif commands or commit_batch:
+                config_result = connection.send_config(commands, commit=commit, candidate_name=batch_token)
+                result.update(config_result)
 
     except Exception as e:
-        connection.disconnect()
         module.fail_json(msg=f'Resource operation failed: {str(e)}')
 
     module.exit_json(**result)
@@ -20,6 +20,9 @@ options:
   config:
     description:
       - List of configuration commands to validate
+      - For large configurations (more than a few thousand lines) prefer
+        I(config_file), which is read from disk by the module instead of
+        being passed and type-checked as a task argument
     required: false
     type: list
     elements: str
@@ -152,62 +155,97 @@ validation_summary:
 '''
 
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.chasewoodard93.srlinux.plugins.module_utils.srlinux import SRLinuxConnection
-import os
+from ansible_collections.chasewoodard93.srlinux.plugins.module_utils.srlinux import get_connection
 import re
 
 
+# Commands a configuration may contain, and the path that must follow them
+_COMMAND_PREFIXES = ('set ', 'delete ')
+
+# Any line of a newline-joined command list that is not blank, not a comment
+# and not a set or delete of a path
+_BAD_COMMAND_RE = re.compile(r'^(?![ \t]*(?:#|$)|[ \t]*(?:set|delete) [^\S\n]*/).*$', re.MULTILINE)
+
+# Device replies to a rejected line: a missing reference only warns
+_REFERENCE_RE = re.compile(r'not found|does not exist', re.I)
+_INVALID_RE = re.compile(r'invalid|error', re.I)
+
+
+def filter_commands(lines):
+    """Return the stripped lines that are neither blank nor comments."""
+    return [
+        line for line in map(str.strip, lines)
+        if line and not line.startswith('#')
+    ]
+
+
+def read_commands(path):
+    """
+    Read the commands of a configuration file.
+
+    Lines are filtered as bytes and only the commands that remain are
+    decoded, so comments and blank lines never go through the codec.
+
+    Args:
+        path: Path of the configuration file
+
+    Returns:
+        list: Stripped command lines
+    """
+    with open(path, 'rb') as f:
+        return [
+            line.decode('utf-8', errors='replace') for line in map(bytes.strip, f)
+            if line and not line.startswith(b'#')
+        ]
+
+
 def validate_syntax(commands):
     """Validate command syntax."""
     errors = []
-    valid_prefixes = ['set ', 'delete ']
-
-    for i, cmd in enumerate(commands):
-        cmd = cmd.strip()
-        if not cmd or cmd.startswith('#'):
-            continue
-
-        # Check for valid prefix
-        if not any(cmd.startswith(prefix) for prefix in valid_prefixes):
-            errors.append({
-                'type': 'syntax',
-                'line': i + 1,
-                'command': cmd,
-                'message': f'Command must start with "set" or "delete"'
-            })
-            continue
-
-        # Check for path format
-        if not re.search(r'^(set|delete)\s+/', cmd):
-            errors.append({
-                'type': 'syntax',
-                'line': i + 1,
-                'command': cmd,
-                'message': 'Command must include a path starting with /'
-            })
+
+    # Scan all commands in one regex pass; only bad lines come back
+    text = '\n'.join(commands)
+    line = 0
+    pos = 0
+    for match in _BAD_COMMAND_RE.finditer(text):
+        line += text.count('\n', pos, match.start())
+        pos = match.start()
+        cmd = match.group().strip()
+
+        if not cmd.startswith(_COMMAND_PREFIXES):
+            message = 'Command must start with "set" or "delete"'
+        else:
+            message = 'Command must include a path starting with /'
+        errors.append({
+            'type': 'syntax',
+            'line': line + 1,
+            'command': cmd,
+            'message': message
+        })
 
     return errors
 
 
+ARGUMENT_SPEC = dict(
+    config=dict(type='list', elements='str'),
+    config_file=dict(type='path'),
+    validation_rules=dict(type='list', elements='dict', default=[]),
+    check_syntax=dict(type='bool', default=True),
+    check_references=dict(type='bool', default=True),
+    check_conflicts=dict(type='bool', default=True),
+    host=dict(type='str', required=True),
+    port=dict(type='int', default=22),
+    username=dict(type='str', default='admin'),
+    password=dict(type='str', required=True, no_log=True),
+    timeout=dict(type='int', default=30),
+)
+
+
 def main():
     """Main module execution."""
 
-    argument_spec = dict(
-        config=dict(type='list', elements='str'),
-        config_file=dict(type='path'),
-        validation_rules=dict(type='list', elements='dict', default=[]),
-        check_syntax=dict(type='bool', default=True),
-        check_references=dict(type='bool', default=True),
-        check_conflicts=dict(type='bool', default=True),
-        host=dict(type='str', required=True),
-        port=dict(type='int', default=22),
-        username=dict(type='str', default='admin'),
-        password=dict(type='str', required=True, no_log=True),
-        timeout=dict(type='int', default=30),
-    )
-
     module = AnsibleModule(
-        argument_spec=argument_spec,
+        argument_spec=ARGUMENT_SPEC,
         mutually_exclusive=[['config', 'config_file']],
         required_one_of=[['config', 'config_file']],
         supports_check_mode=True
@@ -221,13 +259,12 @@ def main():
 
     # Load config from file if specified
     if config_file:
-        if not os.path.exists(config_file):
+        try:
+            commands = read_commands(config_file)
+        except FileNotFoundError:
             module.fail_json(msg=f'Config file not found: {config_file}')
-        with open(config_file, 'r') as f:
-            config = [line.strip() for line in f.readlines()]
-
-    # Filter to actual commands
-    commands = [c for c in config if c.strip() and not c.strip().startswith('#')]
+    else:
+        commands = filter_commands(config)
 
     # Initialize result
     # Note: 'warnings' is reserved by Ansible, so we use 'validation_warnings'
@@ -235,13 +272,7 @@ def main():
         'changed': False,
         'valid': True,
         'validation_errors': [],
-        'validation_warnings': [],
-        'validation_summary': {
-            'total_commands': len(commands),
-            'valid_commands': len(commands),
-            'errors': 0,
-            'warnings': 0
-        }
+        'validation_warnings': []
     }
 
     # Syntax validation
@@ -251,44 +282,44 @@ def main():
 
     # Reference validation (requires device connection)
     if check_references and commands:
-        connection = SRLinuxConnection(module)
         try:
-            # Enter candidate mode and try to apply commands
-            connection.enter_candidate_mode()
-            for cmd in commands:
-                try:
-                    connection.execute_command(cmd)
-                except Exception as e:
-                    error_msg = str(e)
-                    if 'not found' in error_msg.lower() or 'does not exist' in error_msg.lower():
+            with get_connection(module) as connection:
+                # Enter candidate mode and apply all commands in one batch;
+                # each command's reply tells whether the device accepted it
+                connection.enter_candidate_mode()
+                outputs = connection.execute_commands(commands)
+                for cmd, error_msg in zip(commands, outputs):
+                    if _REFERENCE_RE.search(error_msg):
                         result['validation_warnings'].append({
                             'type': 'reference',
                             'command': cmd,
                             'message': error_msg
                         })
-                    elif 'invalid' in error_msg.lower() or 'error' in error_msg.lower():
+                    elif _INVALID_RE.search(error_msg):
                         result['validation_errors'].append({
                             'type': 'validation',
                             'command': cmd,
                             'message': error_msg
                         })
 
-            # Discard candidate changes
-            connection.execute_command('discard now')
-            connection.disconnect()
+                # Discard candidate changes
+                connection.execute_command('discard now')
         except Exception as e:
-            connection.disconnect()
             # Don't fail, just add warning
             result['validation_warnings'].append({
                 'type': 'connection',
                 'message': f'Could not validate references: {str(e)}'
             })
 
-    # Update summary
-    result['validation_summary']['errors'] = len(result['validation_errors'])
-    result['validation_summary']['warnings'] = len(result['validation_warnings'])
-    result['validation_summary']['valid_commands'] = len(commands) - len(result['validation_errors'])
-    result['valid'] = len(result['validation_errors']) == 0
+    # Build summary
+    errors = len(result['validation_errors'])
+    result['validation_summary'] = {
+        'total_commands': len(commands),
+        'valid_commands': len(commands) - errors,
+        'errors': errors,
+        'warnings': len(result['validation_warnings'])
+    }
+    result['valid'] = errors == 0
 
     module.exit_json(**result)
 
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2024, Chase Woodard <chasewoodard93@users.noreply.github.com>
+# MIT License
+
+"""
+SR Linux Fan-out Action Base
+
+Shared scaffolding for action plugins that run a module's work against
+many SR Linux devices concurrently from the controller when I(hosts) is
+set, and fall back to the normal action for a single device.
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible.errors import AnsibleActionFail
+from ansible.plugins.action import ActionBase
+from ansible.plugins.action.normal import ActionModule as NormalActionModule
+from ansible_collections.chasewoodard93.srlinux.plugins.module_utils.srlinux_async import (
+    HAS_ASYNCSSH,
+    resolve_targets,
+    run_concurrently,
+)
+
+
+class FanoutActionModule(NormalActionModule):
+    """Base for action plugins that fan a task out across many SR Linux devices"""
+
+    # Set by subclasses: the module's argument spec, what a fan-out run is
+    # called in messages and the message prefix of a failed host
+    ARGUMENT_SPEC = None
+    FANOUT_NAME = None
+    HOST_FAILED_MSG = None
+
+    def run(self, tmp=None, task_vars=None):
+        # Single device: run the module as the normal action does
+        if not self._task.args.get('hosts'):
+            return super(FanoutActionModule, self).run(tmp, task_vars)
+
+        if task_vars is None:
+            task_vars = dict()
+
+        result = ActionBase.run(self, tmp, task_vars)
+        del tmp
+
+        try:
+            args = self._validate_fanout_args()
+        except AnsibleActionFail as e:
+            result.update(e.result)
+            return result
+
+        if not HAS_ASYNCSSH:
+            result['failed'] = True
+            result['msg'] = f'asyncssh is required for multi-host {self.FANOUT_NAME}. Install it using: pip install asyncssh'
+            return result
+
+        targets = resolve_targets(args['hosts'], task_vars.get('hostvars', {}), {
+            'port': args['port'],
+            'username': args['username'],
+            'password': args['password'],
+            'timeout': args['timeout'],
+        })
+
+        jobs = self._build_jobs(args, targets, result)
+        if jobs is None:
+            return result
+        outcomes = run_concurrently(jobs, args['max_concurrency'])
+
+        result['results'] = []
+        failed = []
+        for name in targets:
+            outcome = outcomes[name]
+            if isinstance(outcome, Exception):
+                failed.append(name)
+                result['results'].append({'host': name, 'failed': True, 'msg': f'{self.HOST_FAILED_MSG}: {str(outcome)}'})
+            else:
+                outcome['host'] = name
+                result['results'].append(outcome)
+
+        self._summarize(args, targets, failed, result)
+        return result
+
+    def _validate_fanout_args(self):
+        """Validate the task arguments against the module's spec and return them with defaults"""
+        if self._task.async_val:
+            raise AnsibleActionFail('async is not supported when hosts is set')
+
+        dummy, args = self.validate_argument_spec(
+            argument_spec=self.ARGUMENT_SPEC,
+            required_one_of=[['host', 'hosts']],
+        )
+        if args['max_concurrency'] < 1:
+            raise AnsibleActionFail('max_concurrency must be at least 1')
+        return args
+
+    def _build_jobs(self, args, targets, result):
+        """
+        Build the coroutine run against each target.
+
+        Args:
+            args: Validated task arguments
+            targets: Inventory hostname to (address, creds) tuple
+            result: Task result, to be filled in when no jobs should run
+
+        Returns:
+            dict: Inventory hostname to coroutine, or None to return result as is
+        """
+        raise NotImplementedError
+
+    def _summarize(self, args, targets, failed, result):
+        """
+        Set the overall status of the task from the per-host results.
+
+        Args:
+            args: Validated task arguments
+            targets: Inventory hostname to (address, creds) tuple
+            failed: Inventory hostnames whose job raised
+            result: Task result, with 'results' already filled in
+        """
+        raise NotImplementedError